@@ -1,48 +1,63 @@
 """Asteroids that move across the screen as obstacles."""
-import random
+from collections import OrderedDict
 import pygame
 import math
+import numpy as np
+from collision import first_impact
+from spatial import candidate_pairs, wrapped_delta
+from poisson import poisson_disc_layout
+from rng import RandomStreams
+
+
+def _column(name, cast=float):
+    """Property that reads and writes one row of an AsteroidField array."""
+    def getter(self):
+        return cast(getattr(self.field, name)[self.index])
+    
+    def setter(self, value):
+        getattr(self.field, name)[self.index] = value
+    
+    return property(getter, setter)
 
 
 class Asteroid:
-    """A rough-shaped grey asteroid obstacle."""
+    """A rough-shaped grey asteroid obstacle.
     
-    def __init__(self, screen_width, screen_height):
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        
-        # Random size
-        self.radius = random.randint(25, 45)
-        
-        # Mass proportional to area (radius squared)
-        self.mass = self.radius * self.radius
-        
-        # Generate rough shape (vertices around a circle with random offsets)
-        self.num_vertices = random.randint(7, 10)
-        self.vertex_offsets = []
-        for i in range(self.num_vertices):
-            # Random offset from base radius (0.7 to 1.3)
-            offset = random.uniform(0.7, 1.3)
-            self.vertex_offsets.append(offset)
-        
-        # Random position
-        self.x = random.uniform(0, screen_width)
-        self.y = random.uniform(0, screen_height)
-        
-        # Random constant velocity (slow drift)
-        speed = random.uniform(30, 80)
-        angle = random.uniform(0, 2 * math.pi)
-        self.vx = speed * math.cos(angle)
-        self.vy = speed * math.sin(angle)
-        
-        # Slight rotation
-        self.rotation = random.uniform(0, 2 * math.pi)
-        self.rotation_speed = random.uniform(-0.5, 0.5)
-        
-        # Grey color with slight variation
-        grey = random.randint(80, 120)
-        self.color = (grey, grey - 10, grey - 20)
-        self.highlight_color = (grey + 30, grey + 20, grey + 10)
+    The physical state lives in the owning AsteroidField's arrays; an
+    Asteroid is a view onto one row of them so per-asteroid code (drawing,
+    spawn avoidance) keeps working against the vectorized field.
+    """
+    
+    x = _column('x')
+    y = _column('y')
+    vx = _column('vx')
+    vy = _column('vy')
+    radius = _column('radius', int)
+    mass = _column('mass')
+    rotation = _column('rotation')
+    rotation_speed = _column('rotation_speed')
+    
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+        self.screen_width = field.screen_width
+        self.screen_height = field.screen_height
+    
+    @property
+    def num_vertices(self):
+        return len(self.vertex_offsets)
+    
+    @property
+    def vertex_offsets(self):
+        return self.field.vertex_offsets[self.index]
+    
+    @property
+    def color(self):
+        return self.field.colors[self.index]
+    
+    @property
+    def highlight_color(self):
+        return self.field.highlight_colors[self.index]
     
     def update(self, dt):
         """Update asteroid position and rotation."""
@@ -53,49 +68,53 @@ class Asteroid:
         # Rotate
         self.rotation += self.rotation_speed * dt
         
-        # Screen wrapping (like player)
-        if self.x - self.radius > self.screen_width:
-            self.x = -self.radius
-        elif self.x + self.radius < 0:
-            self.x = self.screen_width + self.radius
-            
-        if self.y - self.radius > self.screen_height:
-            self.y = -self.radius
-        elif self.y + self.radius < 0:
-            self.y = self.screen_height + self.radius
+        # Screen wrapping (the field draws copies across the edges)
+        self.x %= self.screen_width
+        self.y %= self.screen_height
     
-    def get_vertices(self):
-        """Get the current vertex positions."""
+    def get_vertices(self, position=None, rotation=None):
+        """Get the exact vertex positions (optionally at another position or rotation)."""
         vertices = []
-        for i in range(self.num_vertices):
-            angle = self.rotation + (2 * math.pi * i / self.num_vertices)
-            r = self.radius * self.vertex_offsets[i]
-            x = self.x + r * math.cos(angle)
-            y = self.y + r * math.sin(angle)
-            vertices.append((x, y))
+        x, y = position if position is not None else (self.x, self.y)
+        rotation = self.rotation if rotation is None else rotation
+        radius = self.radius
+        offsets = self.vertex_offsets
+        for i in range(len(offsets)):
+            angle = rotation + (2 * math.pi * i / len(offsets))
+            r = radius * offsets[i]
+            vertices.append((x + r * math.cos(angle), y + r * math.sin(angle)))
         return vertices
     
-    def draw(self, screen):
-        """Draw the asteroid."""
-        vertices = self.get_vertices()
+    def render(self, surface, x, y, rotation):
+        """Draw the asteroid's polygons directly at a position and rotation. Returns the rect drawn."""
+        vertices = self.get_vertices((x, y), rotation)
         
         # Draw main body
-        pygame.draw.polygon(screen, self.color, vertices)
+        pygame.draw.polygon(surface, self.color, vertices)
         
         # Draw outline for definition
-        pygame.draw.polygon(screen, self.highlight_color, vertices, 2)
+        rect = pygame.draw.polygon(surface, self.highlight_color, vertices, 2)
         
         # Add some crater-like details
-        crater_x = self.x + self.radius * 0.2 * math.cos(self.rotation)
-        crater_y = self.y + self.radius * 0.2 * math.sin(self.rotation)
+        crater_x = x + self.radius * 0.2 * math.cos(rotation)
+        crater_y = y + self.radius * 0.2 * math.sin(rotation)
         crater_r = self.radius * 0.2
         darker = (self.color[0] - 20, self.color[1] - 20, self.color[2] - 20)
-        pygame.draw.circle(screen, darker, (int(crater_x), int(crater_y)), int(crater_r))
+        pygame.draw.circle(surface, darker, (int(crater_x), int(crater_y)), int(crater_r))
+        return rect
+    
+    def draw(self, screen, position=None):
+        """Draw the asteroid (optionally at an interpolated position). Returns the rect drawn."""
+        x, y = position if position is not None else (self.x, self.y)
+        sprites = self.field.sprites
+        sprite = sprites.get(self, int(sprites.angle_index(self.rotation)))
+        half = sprite.get_width() / 2
+        return screen.blit(sprite, (x - half, y - half))
     
     def check_collision(self, player_x, player_y, player_radius):
-        """Check if player collides with asteroid."""
-        dx = self.x - player_x
-        dy = self.y - player_y
+        """Check if player collides with asteroid (or its copy across an edge)."""
+        dx = wrapped_delta(self.x - player_x, self.screen_width)
+        dy = wrapped_delta(self.y - player_y, self.screen_height)
         distance = math.sqrt(dx * dx + dy * dy)
         
         # Use slightly smaller collision radius for fairness
@@ -106,89 +125,300 @@ class Asteroid:
         return (self.x, self.y)
 
 
+class AsteroidSpriteCache:
+    """Rotation-quantized asteroid sprites shared across a field, LRU evicted.
+    
+    Each asteroid's shape is rendered once per quantized angle it is seen
+    at, so drawing becomes a single blit. Sprites are keyed by asteroid
+    index and shape version, so a regenerated shape never reuses a stale one.
+    Building a sprite costs several direct draws, so asteroids spinning
+    through angles faster than one per MIN_SPRITE_LIFE seconds are better
+    drawn directly (see worth_caching).
+    """
+    
+    ANGLES = 64
+    MIN_SPRITE_LIFE = 0.1
+    
+    def __init__(self, max_sprites=512):
+        self.max_sprites = max_sprites
+        self.sprites = OrderedDict()
+    
+    def angle_index(self, rotation):
+        """Index of the quantized angle nearest rotation (scalar or array)."""
+        return np.rint(np.asarray(rotation) / (2 * math.pi) * self.ANGLES).astype(int) % self.ANGLES
+    
+    def worth_caching(self, rotation_speed):
+        """Mask of rotation speeds slow enough for a sprite to be reused over several frames."""
+        return np.abs(rotation_speed) * self.MIN_SPRITE_LIFE < 2 * math.pi / self.ANGLES
+    
+    def get(self, asteroid, angle_index):
+        """Sprite of asteroid at a quantized angle, with the asteroid centred."""
+        key = (asteroid.index, asteroid.field.shape_versions[asteroid.index], angle_index)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+        
+        # Square sprite big enough for the furthest vertex plus the outline
+        half = math.ceil(asteroid.radius * max(asteroid.vertex_offsets)) + 2
+        # Colour-keyed rather than per-pixel alpha: asteroids are never pure
+        # black and have hard edges, and RLE colour-key blits are much faster
+        sprite = pygame.Surface((half * 2, half * 2))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        sprite.fill((0, 0, 0))
+        asteroid.render(sprite, half, half, 2 * math.pi * angle_index / self.ANGLES)
+        sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
+
+
 class AsteroidField:
-    """Manages multiple asteroids."""
+    """Manages multiple asteroids as struct-of-arrays state.
     
-    def __init__(self, screen_width, screen_height, count=3):
+    Positions, velocities, radii, masses and rotation are contiguous float
+    arrays so integration, wrapping and player tests run vectorized.
+    """
+    
+    def __init__(self, screen_width, screen_height, count=3, streams=None, keep_out=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.asteroids = []
         
-        for _ in range(count):
-            self.asteroids.append(Asteroid(screen_width, screen_height))
+        # Separate streams for shapes, collision spin and respawns
+        if streams is None:
+            streams = RandomStreams()
+        self.rng = streams.python('asteroids')
+        self.spin_rng = streams.python('asteroid_spin')
+        self.respawn_rng = streams.python('asteroid_respawn')
+        
+        # Physical state, one row per asteroid
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        self.radius = np.zeros(count)
+        self.mass = np.zeros(count)
+        self.rotation = np.zeros(count)
+        self.rotation_speed = np.zeros(count)
+        
+        # Positions at the start of the last update, for render interpolation
+        self.prev_x = np.zeros(count)
+        self.prev_y = np.zeros(count)
+        
+        # Shape and colour (only needed for drawing)
+        self.vertex_offsets = [None] * count
+        self.colors = [None] * count
+        self.highlight_colors = [None] * count
+        self.shape_versions = [0] * count
+        # Room for every asteroid's current sprite and its next angle, so a
+        # big field doesn't evict sprites it is about to draw
+        self.sprites = AsteroidSpriteCache(max_sprites=max(512, 2 * count))
+        
+        for i in range(count):
+            self._generate(i)
+        
+        # Spread out without overlaps, clear of keep_out (x, y, distance)
+        self.x[:], self.y[:] = poisson_disc_layout(self.radius, screen_width, screen_height,
+                                                   self.rng, keep_out=keep_out)
+        
+        self.asteroids = [Asteroid(self, i) for i in range(count)]
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+    
+    def __len__(self):
+        return len(self.asteroids)
+    
+    def _generate(self, i):
+        """Randomize the shape, size and motion of asteroid i (positions are laid out together)."""
+        self.shape_versions[i] += 1
+        
+        # Random size, mass proportional to area (radius squared)
+        radius = self.rng.randint(25, 45)
+        self.radius[i] = radius
+        self.mass[i] = radius * radius
+        
+        # Generate rough shape (vertices around a circle with random offsets 0.7 to 1.3)
+        num_vertices = self.rng.randint(7, 10)
+        self.vertex_offsets[i] = [self.rng.uniform(0.7, 1.3) for _ in range(num_vertices)]
+        
+        # Random constant velocity (slow drift)
+        speed = self.rng.uniform(30, 80)
+        angle = self.rng.uniform(0, 2 * math.pi)
+        self.vx[i] = speed * math.cos(angle)
+        self.vy[i] = speed * math.sin(angle)
+        
+        # Slight rotation
+        self.rotation[i] = self.rng.uniform(0, 2 * math.pi)
+        self.rotation_speed[i] = self.rng.uniform(-0.5, 0.5)
+        
+        # Grey color with slight variation
+        grey = self.rng.randint(80, 120)
+        self.colors[i] = (grey, grey - 10, grey - 20)
+        self.highlight_colors[i] = (grey + 30, grey + 20, grey + 10)
     
     def update(self, dt):
         """Update all asteroids and handle collisions between them."""
-        # Update positions
-        for asteroid in self.asteroids:
-            asteroid.update(dt)
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        
+        # Integrate positions and rotation
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.rotation += self.rotation_speed * dt
+        
+        # Screen wrapping (like player)
+        self._wrap(self.x, self.screen_width)
+        self._wrap(self.y, self.screen_height)
         
         # Check and resolve collisions between asteroids
         self._resolve_asteroid_collisions()
     
+    def _wrap(self, pos, extent):
+        """Wrap positions onto the screen along one axis.
+        
+        The field repeats every screen width and height (an asteroid across
+        an edge is drawn on both sides), so the wrapped distances used for
+        collisions match what is on screen.
+        """
+        np.mod(pos, extent, out=pos)
+    
     def _resolve_asteroid_collisions(self):
         """Check for and resolve collisions between asteroids using elastic collision."""
-        for i in range(len(self.asteroids)):
-            for j in range(i + 1, len(self.asteroids)):
-                a1 = self.asteroids[i]
-                a2 = self.asteroids[j]
-                
-                # Calculate distance between centers
-                dx = a2.x - a1.x
-                dy = a2.y - a1.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                # Check if colliding
-                min_dist = a1.radius + a2.radius
-                if distance < min_dist and distance > 0:
-                    # Normalize collision vector
-                    nx = dx / distance
-                    ny = dy / distance
-                    
-                    # Relative velocity
-                    dvx = a1.vx - a2.vx
-                    dvy = a1.vy - a2.vy
-                    
-                    # Relative velocity along collision normal
-                    dvn = dvx * nx + dvy * ny
-                    
-                    # Only resolve if asteroids are moving toward each other
-                    if dvn > 0:
-                        # Calculate impulse (elastic collision)
-                        # Using conservation of momentum and kinetic energy
-                        # impulse = 2 * m1 * m2 / (m1 + m2) * dvn
-                        total_mass = a1.mass + a2.mass
-                        impulse = 2 * dvn / total_mass
-                        
-                        # Apply impulse to velocities (weighted by mass)
-                        a1.vx -= impulse * a2.mass * nx
-                        a1.vy -= impulse * a2.mass * ny
-                        a2.vx += impulse * a1.mass * nx
-                        a2.vy += impulse * a1.mass * ny
-                        
-                        # Add some spin on collision
-                        a1.rotation_speed += random.uniform(-0.3, 0.3)
-                        a2.rotation_speed += random.uniform(-0.3, 0.3)
-                    
-                    # Separate overlapping asteroids
-                    overlap = min_dist - distance
-                    separation = overlap / 2 + 1
-                    a1.x -= nx * separation
-                    a1.y -= ny * separation
-                    a2.x += nx * separation
-                    a2.y += ny * separation
-    
-    def draw(self, screen):
-        """Draw all asteroids."""
-        for asteroid in self.asteroids:
-            asteroid.draw(screen)
+        # Broad phase: wrap-aware spatial hash, only neighbouring pairs
+        pairs_i, pairs_j = candidate_pairs(self.x, self.y, self.radius,
+                                           self.screen_width, self.screen_height)
+        if len(pairs_i) == 0:
+            return
+        
+        # Narrow phase: vectorized overlap test across the screen wrap
+        dx = wrapped_delta(self.x[pairs_j] - self.x[pairs_i], self.screen_width)
+        dy = wrapped_delta(self.y[pairs_j] - self.y[pairs_i], self.screen_height)
+        min_dist = self.radius[pairs_i] + self.radius[pairs_j]
+        overlapping = dx * dx + dy * dy < min_dist * min_dist
+        
+        for i, j in zip(pairs_i[overlapping].tolist(), pairs_j[overlapping].tolist()):
+            self._resolve_pair(i, j)
+    
+    def _resolve_pair(self, i, j):
+        """Resolve one asteroid pair with an elastic impulse and separation."""
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        
+        # Calculate distance between centers (shortest way round the wrap)
+        dx = wrapped_delta(x[j] - x[i], self.screen_width)
+        dy = wrapped_delta(y[j] - y[i], self.screen_height)
+        distance = math.sqrt(dx * dx + dy * dy)
+        
+        # Check if colliding
+        min_dist = self.radius[i] + self.radius[j]
+        if not (distance < min_dist and distance > 0):
+            return
+        
+        # Normalize collision vector
+        nx = dx / distance
+        ny = dy / distance
+        
+        # Relative velocity along collision normal
+        dvn = (vx[i] - vx[j]) * nx + (vy[i] - vy[j]) * ny
+        
+        # Only resolve if asteroids are moving toward each other
+        if dvn > 0:
+            # Elastic collision: impulse = 2 * m1 * m2 / (m1 + m2) * dvn
+            m1 = self.mass[i]
+            m2 = self.mass[j]
+            impulse = 2 * dvn / (m1 + m2)
+            
+            # Apply impulse to velocities (weighted by mass)
+            vx[i] -= impulse * m2 * nx
+            vy[i] -= impulse * m2 * ny
+            vx[j] += impulse * m1 * nx
+            vy[j] += impulse * m1 * ny
+            
+            # Add some spin on collision
+            self.rotation_speed[i] += self.spin_rng.uniform(-0.3, 0.3)
+            self.rotation_speed[j] += self.spin_rng.uniform(-0.3, 0.3)
+        
+        # Separate overlapping asteroids
+        separation = (min_dist - distance) / 2 + 1
+        x[i] -= nx * separation
+        y[i] -= ny * separation
+        x[j] += nx * separation
+        y[j] += ny * separation
+    
+    def render_positions(self, alpha=1.0):
+        """Positions blended between the last two updates for rendering.
+        
+        Steps across a screen edge blend the short way round; asteroids
+        that jumped (respawn) are not blended.
+        """
+        dx = wrapped_delta(self.x - self.prev_x, self.screen_width)
+        dy = wrapped_delta(self.y - self.prev_y, self.screen_height)
+        jumped = (np.abs(dx) > self.screen_width / 2) | (np.abs(dy) > self.screen_height / 2)
+        blend = np.where(jumped, 1.0, alpha)
+        return self.prev_x + dx * blend, self.prev_y + dy * blend
+    
+    def _edge_copies(self, xs, ys):
+        """Indices and positions of every asteroid to draw, with an extra
+        copy on the far side of each screen edge an asteroid overlaps."""
+        width, height = self.screen_width, self.screen_height
+        # Furthest vertex (offsets up to 1.3) plus the outline
+        reach = self.radius * 1.3 + 2
+        indices = [np.arange(len(xs))]
+        copies_x = [xs]
+        copies_y = [ys]
+        for shift_x in (-width, 0, width):
+            for shift_y in (-height, 0, height):
+                if shift_x == 0 and shift_y == 0:
+                    continue
+                # A copy shifted left is needed when the asteroid pokes past the right edge, etc.
+                near = np.ones(len(xs), dtype=bool)
+                if shift_x:
+                    near &= (xs + reach > width) if shift_x < 0 else (xs - reach < 0)
+                if shift_y:
+                    near &= (ys + reach > height) if shift_y < 0 else (ys - reach < 0)
+                near = np.flatnonzero(near)
+                if len(near):
+                    indices.append(near)
+                    copies_x.append(xs[near] + shift_x)
+                    copies_y.append(ys[near] + shift_y)
+        return np.concatenate(indices), np.concatenate(copies_x), np.concatenate(copies_y)
+    
+    def draw(self, screen, alpha=1.0):
+        """Draw all asteroids, and their copies across the screen edges. Returns the rects drawn."""
+        indices, xs, ys = self._edge_copies(*self.render_positions(alpha))
+        angles = self.sprites.angle_index(self.rotation)[indices]
+        cached = self.sprites.worth_caching(self.rotation_speed)[indices]
+        asteroids = [self.asteroids[i] for i in indices.tolist()]
+        blits = []
+        rects = []
+        for asteroid, x, y, angle, use_sprite in zip(asteroids, xs.tolist(), ys.tolist(),
+                                                     angles.tolist(), cached.tolist()):
+            if not use_sprite:
+                # Spinning too fast for a sprite to pay off
+                rects.append(asteroid.render(screen, x, y, asteroid.rotation))
+                continue
+            sprite = self.sprites.get(asteroid, angle)
+            half = sprite.get_width() / 2
+            blits.append((sprite, (x - half, y - half)))
+        return screen.blits(blits) + rects
     
     def check_collision(self, player_x, player_y, player_radius):
-        """Check if player collides with any asteroid."""
-        for asteroid in self.asteroids:
-            if asteroid.check_collision(player_x, player_y, player_radius):
-                return True
-        return False
+        """Check if player collides with any asteroid (or copy across an edge)."""
+        dx = wrapped_delta(self.x - player_x, self.screen_width)
+        dy = wrapped_delta(self.y - player_y, self.screen_height)
+        # Use slightly smaller collision radius for fairness
+        reach = self.radius * 0.8 + player_radius
+        return bool(np.any(dx * dx + dy * dy < reach * reach))
+    
+    def sweep_collision(self, segments, player_radius, dt):
+        """Fraction of the step at which the player's swept path first
+        touches any asteroid (each moving over the same dt), or None.
+        Asteroids across an edge are tested at their copy nearest the player."""
+        return first_impact(segments, self.x, self.y, self.vx, self.vy,
+                            self.radius * 0.8 + player_radius, dt,
+                            wrap=(self.screen_width, self.screen_height))
     
     def get_asteroids(self):
         """Return list of asteroids for spawn avoidance."""
@@ -196,16 +426,10 @@ class AsteroidField:
     
     def respawn_away_from(self, x, y, min_distance):
         """Respawn all asteroids away from a point (e.g., after player death)."""
-        for asteroid in self.asteroids:
-            attempts = 0
-            while attempts < 50:
-                asteroid.x = random.uniform(0, self.screen_width)
-                asteroid.y = random.uniform(0, self.screen_height)
-                
-                dx = asteroid.x - x
-                dy = asteroid.y - y
-                dist = math.sqrt(dx * dx + dy * dy)
-                
-                if dist > min_distance:
-                    break
-                attempts += 1
\ No newline at end of file
+        # Fresh non-overlapping layout, every asteroid at least min_distance clear of the point
+        self.x[:], self.y[:] = poisson_disc_layout(self.radius, self.screen_width, self.screen_height,
+                                                   self.respawn_rng, keep_out=(x, y, min_distance))
+        
+        # Teleported, so don't blend from the old positions
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
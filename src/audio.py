@@ -1,58 +1,258 @@
 """Procedural sound generation using pygame.mixer."""
+from collections import OrderedDict
+import threading
 import pygame
 import numpy as np
 
 
+class SoundBank:
+    """Synthesizes each procedural sound once and replays the cached Sound.
+    
+    Sounds are keyed by their synthesis parameters. Parameterized variants
+    (e.g. pitch-shifted pickups) share a bounded LRU cache; preloaded sounds
+    are pinned and never evicted.
+    """
+    
+    def __init__(self, sample_rate, channels, max_variants=32):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.max_variants = max_variants
+        self.pinned = {}
+        self.variants = OrderedDict()
+    
+    def get(self, name, **params):
+        """Return the Sound for a synthesizer name and parameters."""
+        key = (name,) + tuple(sorted(params.items()))
+        sound = self.pinned.get(key)
+        if sound is not None:
+            return sound
+        
+        sound = self.variants.get(key)
+        if sound is not None:
+            self.variants.move_to_end(key)
+            return sound
+        
+        sound = self._make_sound(getattr(self, '_synth_' + name)(**params))
+        self.variants[key] = sound
+        if len(self.variants) > self.max_variants:
+            self.variants.popitem(last=False)
+        return sound
+    
+    def preload(self, name, **params):
+        """Synthesize a sound now and keep it for the lifetime of the bank."""
+        key = (name,) + tuple(sorted(params.items()))
+        if key not in self.pinned:
+            self.pinned[key] = self._make_sound(getattr(self, '_synth_' + name)(**params))
+        return self.pinned[key]
+    
+    def _make_sound(self, wave):
+        """Convert a float waveform (-1 to 1) to a Sound in the mixer's layout."""
+        wave = (np.clip(wave, -1.0, 1.0) * 32767).astype(np.int16)
+        if self.channels > 1:
+            # Duplicate the mono signal into every output channel
+            wave = np.repeat(wave[:, None], self.channels, axis=1)
+        return pygame.sndarray.make_sound(np.ascontiguousarray(wave))
+    
+    def _synth_chirp(self, frequency, duration, decay, bend):
+        """Sine with exponential decay and a slight upward pitch bend."""
+        # Generate samples
+        samples = int(duration * self.sample_rate)
+        t = np.linspace(0, duration, samples, False)
+        
+        # Envelope: quick attack, exponential decay
+        envelope = np.exp(-t * decay)
+        
+        # Pitch bend up over the duration
+        bend_factor = 1 + bend * t / duration
+        return np.sin(2 * np.pi * frequency * t * bend_factor) * envelope
+
+
+def pan_gains(pan):
+    """Equal-power (left, right) gains for a pan position from 0 (left) to 1 (right)."""
+    angle = max(0.0, min(1.0, pan)) * np.pi / 2
+    return float(np.cos(angle)), float(np.sin(angle))
+
+
+class VoicePool:
+    """A fixed set of reserved mixer channels shared by one-shot sounds.
+    
+    A new sound takes a free voice if there is one, otherwise it steals the
+    busy voice with the lowest priority not above its own; if every voice is
+    busy with something more important the new sound is dropped.
+    """
+    
+    def __init__(self, first_channel, count):
+        self.voices = [pygame.mixer.Channel(first_channel + i) for i in range(count)]
+        self.priorities = [0] * count
+    
+    def play(self, sound, priority=0, pan=0.5):
+        """Play sound on a voice. Returns False if it was dropped."""
+        index = None
+        for i, voice in enumerate(self.voices):
+            if not voice.get_busy():
+                index = i
+                break
+        
+        if index is None:
+            # Steal the least important voice, if the new sound outranks it
+            lowest = min(range(len(self.voices)), key=lambda i: self.priorities[i])
+            if self.priorities[lowest] > priority:
+                return False
+            index = lowest
+        
+        voice = self.voices[index]
+        self.priorities[index] = priority
+        voice.set_volume(*pan_gains(pan))
+        voice.play(sound)
+        return True
+
+
+class ThrustHum:
+    """Continuously modulated engine tone streamed from a background thread.
+    
+    The game thread only calls set_target(); the worker synthesizes short
+    blocks with NumPy, gliding pitch, level and pan across each block to
+    avoid clicks, and queues them on a dedicated mixer channel.
+    """
+    
+    BLOCK_FRAMES = 1024
+    BASE_FREQUENCY = 55.0  # Hz at the lightest thrust
+    
+    def __init__(self, channel, sample_rate, channels):
+        self.channel = channel
+        self.sample_rate = sample_rate
+        self.channels = channels
+        
+        # Target set by the game thread (a single tuple assignment is atomic)
+        self.target = (0.0, 0.0, 0.5)  # (magnitude 0-1, level 0-1, pan 0-1)
+        
+        # Synthesis state, owned by the worker thread
+        self.phase = 0.0
+        self.current = self.target
+        
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='thrust-hum', daemon=True)
+        self.thread.start()
+    
+    def set_target(self, magnitude, pan):
+        """Set thrust magnitude (0-1) and stereo pan (0 left to 1 right)."""
+        magnitude = max(0.0, min(1.0, magnitude))
+        self.target = (magnitude, 0.25 * magnitude, pan)
+    
+    def _run(self):
+        """Keep one block queued behind the one playing while there is sound."""
+        block_time = self.BLOCK_FRAMES / self.sample_rate
+        while not self.stop_event.wait(block_time / 4):
+            if self.channel.get_queue() is not None:
+                continue
+            target = self.target
+            if target[1] == 0 and self.current[1] == 0:
+                continue  # Silent: nothing to stream
+            block = self._synthesize_block(target)
+            sound = pygame.sndarray.make_sound(block)
+            if self.channel.get_busy():
+                self.channel.queue(sound)
+            else:
+                self.channel.play(sound)
+    
+    def _synthesize_block(self, target):
+        """Render one block gliding from the current to the target parameters."""
+        ramp = np.linspace(0.0, 1.0, self.BLOCK_FRAMES, endpoint=False)
+        (mag0, level0, pan0), (mag1, level1, pan1) = self.current, target
+        self.current = target
+        
+        # Pitch rises an octave from no thrust to full thrust
+        frequency = self.BASE_FREQUENCY * (1.0 + mag0 + (mag1 - mag0) * ramp)
+        phase = self.phase + np.cumsum(2 * np.pi * frequency / self.sample_rate)
+        self.phase = float(phase[-1] % (2 * np.pi))
+        
+        # Fundamental plus a rougher second and third harmonic
+        wave = np.sin(phase) + 0.4 * np.sin(2 * phase) + 0.2 * np.sin(3 * phase)
+        wave *= (level0 + (level1 - level0) * ramp) / 1.6
+        
+        samples = (np.clip(wave, -1.0, 1.0) * 32767)
+        if self.channels == 1:
+            return samples.astype(np.int16)
+        left0, right0 = pan_gains(pan0)
+        left1, right1 = pan_gains(pan1)
+        block = np.empty((self.BLOCK_FRAMES, self.channels), dtype=np.int16)
+        block[:] = samples[:, None].astype(np.int16)
+        block[:, 0] = samples * (left0 + (left1 - left0) * ramp)
+        block[:, 1] = samples * (right0 + (right1 - right0) * ramp)
+        return block
+    
+    def stop(self):
+        """Stop the worker thread and silence the channel."""
+        self.stop_event.set()
+        self.thread.join()
+        self.channel.stop()
+
+
 class AudioManager:
     """Generates and plays procedural audio."""
     
+    # Collection sound: 150ms, 800 Hz, bending up 20%
+    COLLECTION_SOUND = {'frequency': 800, 'duration': 0.15, 'decay': 8, 'bend': 0.2}
+    # Asteroid hit: 400ms low thud bending down
+    HIT_SOUND = {'frequency': 140, 'duration': 0.4, 'decay': 6, 'bend': -0.5}
+    
+    # Mixer channel 0 streams the thrust hum; the next VOICES are one-shots
+    VOICES = 6
+    COLLECTION_PRIORITY = 1
+    HIT_PRIORITY = 2
+    
     def __init__(self):
         self.audio_available = True
+        self.sample_rate = 22050
+        self.channels = 1
+        self.sound_bank = None
+        self.voices = None
+        self.thrust_hum = None
         try:
             pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=512)
-            self.sample_rate = 22050
+            # The mixer may already be open (pygame.init) with another layout
+            self.sample_rate, _, self.channels = pygame.mixer.get_init()
         except pygame.error:
             # Audio not available (e.g., headless environment)
             self.audio_available = False
-            self.sample_rate = 22050
-        
-    def play_collection_sound(self):
-        """Play the collection sound effect."""
-        if not self.audio_available:
             return
-            
-        duration = 0.15  # 150ms
-        frequency = 800  # Hz
-        
-        # Generate samples
-        samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, samples, False)
-        
-        # Sine wave
-        wave = np.sin(2 * np.pi * frequency * t)
-        
-        # Envelope: quick attack, medium decay
-        envelope = np.exp(-t * 8)  # Exponential decay
         
-        # Apply envelope
-        wave = wave * envelope
+        self.sound_bank = SoundBank(self.sample_rate, self.channels)
+        self.sound_bank.preload('chirp', **self.COLLECTION_SOUND)
+        self.sound_bank.preload('chirp', **self.HIT_SOUND)
         
-        # Add slight pitch bend up
-        bend_factor = 1 + 0.2 * t / duration
-        bent_wave = np.sin(2 * np.pi * frequency * t * bend_factor)
-        wave = bent_wave * envelope
+        # Reserve our channels so nothing else plays over them
+        pygame.mixer.set_num_channels(1 + self.VOICES)
+        pygame.mixer.set_reserved(1 + self.VOICES)
+        self.voices = VoicePool(1, self.VOICES)
+        self.thrust_hum = ThrustHum(pygame.mixer.Channel(0), self.sample_rate, self.channels)
+    
+    def play_collection_sound(self, pitch=1.0, pan=0.5):
+        """Play the collection sound effect (optionally pitch-shifted and panned)."""
+        if not self.audio_available:
+            return
         
-        # Convert to 16-bit integer
-        wave = (wave * 32767).astype(np.int16)
+        params = dict(self.COLLECTION_SOUND)
+        params['frequency'] = round(params['frequency'] * pitch)
+        self.voices.play(self.sound_bank.get('chirp', **params), self.COLLECTION_PRIORITY, pan)
+    
+    def play_hit_sound(self, pan=0.5):
+        """Play the asteroid hit sound effect."""
+        if not self.audio_available:
+            return
         
-        # Reshape to stereo (duplicate for left and right channels)
-        wave = np.column_stack((wave, wave))
+        self.voices.play(self.sound_bank.get('chirp', **self.HIT_SOUND), self.HIT_PRIORITY, pan)
+    
+    def set_thrust(self, magnitude, pan=0.5):
+        """Update the thrust hum (magnitude 0-1, pan 0 left to 1 right).
         
-        # Create sound
-        sound = pygame.sndarray.make_sound(wave)
-        sound.play()
+        Cheap enough to call every frame; synthesis happens off-thread.
+        """
+        if self.thrust_hum is not None:
+            self.thrust_hum.set_target(magnitude, pan)
     
     def cleanup(self):
         """Clean up audio resources."""
         if self.audio_available:
+            self.thrust_hum.stop()
             pygame.mixer.quit()
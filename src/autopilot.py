@@ -0,0 +1,98 @@
+"""Autopilot bot that plays by generating mouse deltas."""
+import math
+from collections import deque
+import numpy as np
+from spatial import wrapped_delta
+from rng import RandomStreams
+
+
+class Autopilot:
+    """Steers the player toward the collectible while dodging asteroids.
+
+    Called once per input frame as autopilot(sim), it returns the mouse
+    delta (dx, dy) a player would make, for Simulation.step or a synthetic
+    MOUSEMOTION event. The bot feels its own motion at once but sees the
+    target and asteroids as they were reaction_delay seconds ago (asteroid
+    drift is extrapolated), and each delta gets Gaussian noise.
+    """
+    
+    def __init__(self, reaction_delay=0.15, noise=1.5, rate=60, seed=None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.noise = noise
+        self.rng = RandomStreams(seed).python('autopilot')
+        
+        # World snapshots queued for reaction_delay seconds at rate frames per second
+        self.rate = rate
+        self.frames = round(reaction_delay * rate)
+        self.seen = deque()
+        
+        # Steering
+        self.cruise_speed = 320.0  # px/s toward the target
+        self.brake_distance = 120.0  # Slow down inside this distance
+        self.look_ahead = 1.0  # Seconds to predict asteroid approaches
+        self.clearance = 40.0  # Extra room to keep around asteroids
+        self.dodge_speed = 400.0
+        self.gain = 0.1  # Mouse pixels per px/s of velocity error
+        self.max_delta = 25  # Largest mouse move in one frame
+    
+    def __call__(self, sim):
+        field = sim.asteroid_field
+        self.seen.append((sim.collectible.x, sim.collectible.y,
+                          field.x.copy(), field.y.copy(), field.vx.copy(), field.vy.copy()))
+        while len(self.seen) > self.frames + 1:
+            self.seen.popleft()
+        dx, dy = self._decide(sim, *self.seen[0])
+        if dx == 0 and dy == 0:
+            return (0, 0)
+        dx += self.rng.gauss(0, self.noise)
+        dy += self.rng.gauss(0, self.noise)
+        return (int(round(dx)), int(round(dy)))
+    
+    def _decide(self, sim, target_x, target_y, asteroid_x, asteroid_y, asteroid_vx, asteroid_vy):
+        """Mouse delta toward a (remembered) target and away from asteroids, before noise."""
+        player = sim.player
+        width, height = sim.screen_width, sim.screen_height
+        
+        # Intercept: the target is still, so head the short way round the wrap
+        dx = wrapped_delta(target_x - player.x, width)
+        dy = wrapped_delta(target_y - player.y, height)
+        distance = math.sqrt(dx * dx + dy * dy) or 1.0
+        speed = self.cruise_speed * min(1.0, distance / self.brake_distance)
+        want_x = dx / distance * speed
+        want_y = dy / distance * speed
+        
+        # Avoid: closest approach of each asteroid over the look-ahead, from
+        # where its remembered drift has carried it by now
+        lag = (len(self.seen) - 1) / self.rate
+        rel_x = wrapped_delta(asteroid_x + asteroid_vx * lag - player.x, width)
+        rel_y = wrapped_delta(asteroid_y + asteroid_vy * lag - player.y, height)
+        rel_vx = asteroid_vx - player.vx
+        rel_vy = asteroid_vy - player.vy
+        speed_sq = rel_vx * rel_vx + rel_vy * rel_vy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.clip(-(rel_x * rel_vx + rel_y * rel_vy) / speed_sq, 0.0, self.look_ahead)
+        t = np.where(speed_sq > 0, t, 0.0)
+        near_x = rel_x + rel_vx * t
+        near_y = rel_y + rel_vy * t
+        near = np.sqrt(near_x * near_x + near_y * near_y)
+        danger_radius = sim.asteroid_field.radius * 0.8 + player.radius + self.clearance
+        for i in np.flatnonzero(near < danger_radius).tolist():
+            # Push away from where the asteroid will be, harder when it's sooner
+            urgency = (1.0 - near[i] / danger_radius[i]) * (1.0 - t[i] / self.look_ahead)
+            away = near[i] or 1.0
+            want_x -= near_x[i] / away * self.dodge_speed * urgency
+            want_y -= near_y[i] / away * self.dodge_speed * urgency
+        
+        limit = self.max_delta
+        return (max(-limit, min(limit, (want_x - player.vx) * self.gain)),
+                max(-limit, min(limit, (want_y - player.vy) * self.gain)))
+    
+    def choose(self, sim):
+        """A transition-screen choice: (param_name, delta) for a random button."""
+        param_name = self.rng.choice(['strength', 'smoothness'])
+        value = sim.swipe_processor.get_parameters()[param_name]
+        delta = self.rng.choice([-1, 1])
+        if not 0 <= value + delta <= 10:
+            delta = -delta
+        return (param_name, delta)
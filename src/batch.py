@@ -0,0 +1,368 @@
+"""Many independent game rounds stepped in lockstep as NumPy arrays."""
+import math
+import numpy as np
+from collision import time_of_impact
+from spatial import wrapped_delta
+from rng import RandomStreams
+from simulation import THRUST_REFERENCE_RATE
+
+
+class BatchedGame:
+    """N copies of a playing round, one row per environment.
+
+    Follows the rules of Simulation.step (with input released every step),
+    Player.update and AsteroidField.update, vectorized over the batch:
+    thrust smoothing, wrapping, elastic asteroid collisions, swept pickups
+    and hits, respawns and the round timer. Random draws come from one
+    batch stream, so results match the single-game rules but not a
+    particular Simulation's sequence. Asteroids are placed uniformly
+    rather than with AsteroidField's Poisson-disc layout, so they may start
+    overlapping (the collision pass separates them), and targets by
+    rejection sampling rather than Collectible's occupancy grid, so a
+    crowded screen gets a target that may touch an asteroid instead of
+    none. Environments whose round is over stop changing until reset().
+    """
+    
+    HISTORY = 100  # Thrust smoothing window, as Simulation.thrust_history
+    
+    def __init__(self, count, screen_width, screen_height, asteroids=3, round_duration=60.0, seed=None):
+        self.count = count
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.asteroid_count = asteroids
+        self.round_duration = round_duration
+        self.rng = RandomStreams(seed).numpy('batch')
+        
+        # Sizes as Player and Collectible derive them
+        self.player_radius = int(screen_width * 0.03)
+        self.collectible_size = int(self.player_radius * 0.8)
+        
+        # Swipe parameters per environment (0-10)
+        self.strength = np.full(count, 5.0)
+        self.smoothness = np.full(count, 5.0)
+        
+        # Player
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        
+        # Thrust: per-environment MotionWindow prefix sums and current vector
+        self.prefix_x = np.zeros((count, self.HISTORY + 1))
+        self.prefix_y = np.zeros((count, self.HISTORY + 1))
+        self.samples = np.zeros(count, dtype=np.int64)
+        self.thrust_x = np.zeros(count)
+        self.thrust_y = np.zeros(count)
+        self.is_thrusting = np.zeros(count, dtype=bool)
+        
+        # Asteroids, shape (count, asteroids)
+        shape = (count, asteroids)
+        self.ax = np.zeros(shape)
+        self.ay = np.zeros(shape)
+        self.avx = np.zeros(shape)
+        self.avy = np.zeros(shape)
+        self.radius = np.zeros(shape)
+        self.mass = np.zeros(shape)
+        self.rotation_speed = np.zeros(shape)
+        
+        # Collectible
+        self.cx = np.zeros(count)
+        self.cy = np.zeros(count)
+        
+        # Round state
+        self.time_remaining = np.zeros(count)
+        self.score = np.zeros(count, dtype=np.int64)
+        self.collisions = np.zeros(count, dtype=np.int64)
+        
+        self.reset()
+    
+    @property
+    def done(self):
+        """Environments whose round has ended."""
+        return self.time_remaining <= 0
+    
+    def set_parameter(self, param_name, value):
+        """Set a swipe parameter for every environment (scalar or per-environment array)."""
+        value = np.clip(np.broadcast_to(np.asarray(value, dtype=float), (self.count,)), 0, 10)
+        if param_name == 'strength':
+            self.strength[:] = value
+        elif param_name == 'smoothness':
+            self.smoothness[:] = value
+    
+    def reset(self, mask=None):
+        """Start a fresh round (new asteroids and target) in the masked environments."""
+        rows = np.arange(self.count) if mask is None else np.flatnonzero(mask)
+        n = len(rows)
+        if n == 0:
+            return
+        shape = (n, self.asteroid_count)
+        
+        self._reset_player(rows)
+        self._release(rows, force=True)
+        
+        # As AsteroidField._generate
+        radius = self.rng.integers(25, 46, shape).astype(float)
+        self.radius[rows] = radius
+        self.mass[rows] = radius * radius
+        self.ax[rows] = self.rng.uniform(0, self.screen_width, shape)
+        self.ay[rows] = self.rng.uniform(0, self.screen_height, shape)
+        speed = self.rng.uniform(30, 80, shape)
+        angle = self.rng.uniform(0, 2 * math.pi, shape)
+        self.avx[rows] = speed * np.cos(angle)
+        self.avy[rows] = speed * np.sin(angle)
+        self.rotation_speed[rows] = self.rng.uniform(-0.5, 0.5, shape)
+        
+        self._spawn_collectible(rows)
+        self.time_remaining[rows] = self.round_duration
+        self.score[rows] = 0
+        self.collisions[rows] = 0
+    
+    def _reset_player(self, rows):
+        self.x[rows] = self.screen_width / 2
+        self.y[rows] = self.screen_height / 2
+        self.vx[rows] = 0.0
+        self.vy[rows] = 0.0
+    
+    def _add_motion(self, rows, rel_x, rel_y):
+        """Simulation.add_motion for the given rows (all with non-zero motion)."""
+        self.is_thrusting[rows] = True
+        
+        # Push onto each row's ring buffer of prefix sums
+        slots = self.HISTORY + 1
+        last = self.samples[rows] % slots
+        self.samples[rows] += 1
+        slot = self.samples[rows] % slots
+        self.prefix_x[rows, slot] = self.prefix_x[rows, last] + rel_x
+        self.prefix_y[rows, slot] = self.prefix_y[rows, last] + rel_y
+        
+        # Mean of the last smoothness * 10 samples
+        held = np.minimum(self.samples[rows], self.HISTORY)
+        n = np.maximum(1, np.minimum((self.smoothness[rows] * 10).astype(np.int64), held))
+        start = (self.samples[rows] - n) % slots
+        avg_x = (self.prefix_x[rows, slot] - self.prefix_x[rows, start]) / n
+        avg_y = (self.prefix_y[rows, slot] - self.prefix_y[rows, start]) / n
+        
+        multiplier = 0.1 + (self.strength[rows] / 10) * 0.9
+        self.thrust_x[rows] = avg_x * multiplier * 0.5
+        self.thrust_y[rows] = avg_y * multiplier * 0.5
+    
+    def _release(self, rows, force=False):
+        """Simulation.release_input for the given rows."""
+        idle = rows if force else rows[~self.is_thrusting[rows]]
+        self.thrust_x[idle] = 0.0
+        self.thrust_y[idle] = 0.0
+        self.samples[idle] = 0
+        self.prefix_x[idle, 0] = 0.0
+        self.prefix_y[idle, 0] = 0.0
+        self.is_thrusting[rows] = False
+    
+    def step(self, dt, motion=None):
+        """Advance every running environment by dt with this step's mouse deltas.
+
+        motion is an (count, 2) array of deltas or None. Returns boolean
+        arrays (collected, hit) for the environments that scored or crashed.
+        """
+        collected = np.zeros(self.count, dtype=bool)
+        hit = np.zeros(self.count, dtype=bool)
+        
+        running = ~self.done
+        if motion is not None:
+            motion = np.asarray(motion)
+            moving = np.flatnonzero(running & ((motion[:, 0] != 0) | (motion[:, 1] != 0)))
+            if len(moving):
+                self._add_motion(moving, motion[moving, 0], motion[moving, 1])
+        
+        # Timer; rounds that end now do nothing else this step
+        self.time_remaining[running] -= dt
+        ended = running & (self.time_remaining <= 0)
+        self.time_remaining[ended] = 0
+        rows = np.flatnonzero(running & ~ended)
+        if len(rows) == 0:
+            return collected, hit
+        
+        # Thrust (a zero thrust adds nothing, so no need to mask it out)
+        thrusting = rows[self.is_thrusting[rows]]
+        scale = dt * THRUST_REFERENCE_RATE
+        self.vx[thrusting] += self.thrust_x[thrusting] * scale
+        self.vy[thrusting] += self.thrust_y[thrusting] * scale
+        
+        segments = self._update_players(rows, dt)
+        self._update_asteroids(rows, dt)
+        
+        # Swept tests against the target and the (moving) asteroids
+        collect_time = self._first_impact(segments, self.cx[rows, None], self.cy[rows, None], 0.0, 0.0,
+                                          float(self.collectible_size + self.player_radius), 0.0)
+        reach = self.radius[rows] * 0.8 + self.player_radius
+        hit_time = self._first_impact(segments, self.ax[rows], self.ay[rows],
+                                      self.avx[rows], self.avy[rows], reach, dt, wrap=True)
+        
+        # Collect only if the target is reached before any asteroid
+        collect = np.isfinite(collect_time) & (collect_time <= hit_time)
+        collected_rows = rows[collect]
+        self.score[collected_rows] += 1
+        self._spawn_collectible(collected_rows)
+        
+        hit_rows = rows[np.isfinite(hit_time)]
+        self._reset_player(hit_rows)
+        self.score[hit_rows] = np.maximum(0, self.score[hit_rows] - 1)
+        self.collisions[hit_rows] += 1
+        self._respawn_asteroids(hit_rows, 150)
+        
+        self._release(rows)
+        
+        collected[collected_rows] = True
+        hit[hit_rows] = True
+        return collected, hit
+    
+    def _update_players(self, rows, dt):
+        """Player.update for the given rows. Returns the swept path segments.
+
+        Segments are (x0, y0, x1, y1, valid) arrays of shape (rows, 2); the
+        second segment is only valid where the player wrapped.
+        """
+        r = self.player_radius
+        step_x = self.vx[rows] * dt
+        step_y = self.vy[rows] * dt
+        start_x = self.x[rows]
+        start_y = self.y[rows]
+        end_x = start_x + step_x
+        end_y = start_y + step_y
+        
+        # Screen wrapping
+        x = np.where(end_x - r > self.screen_width, -r,
+                     np.where(end_x + r < 0, self.screen_width + r, end_x))
+        y = np.where(end_y - r > self.screen_height, -r,
+                     np.where(end_y + r < 0, self.screen_height + r, end_y))
+        self.x[rows] = x
+        self.y[rows] = y
+        
+        wrapped = (x != end_x) | (y != end_y)
+        return (np.stack([start_x, x - step_x], axis=1),
+                np.stack([start_y, y - step_y], axis=1),
+                np.stack([end_x, x], axis=1),
+                np.stack([end_y, y], axis=1),
+                np.stack([np.ones_like(wrapped), wrapped], axis=1))
+    
+    def _first_impact(self, segments, target_x, target_y, target_vx, target_vy, reach, dt, wrap=False):
+        """collision.first_impact per row against (rows, targets) arrays; inf for no contact.
+        With wrap, targets are tested at their copy nearest the mover, as asteroids are."""
+        x0, y0, x1, y1, valid = segments
+        best = np.full(len(x0), np.inf)
+        for k in range(x0.shape[1]):
+            rel_x = x0[:, k, None] - (target_x - target_vx * dt)
+            rel_y = y0[:, k, None] - (target_y - target_vy * dt)
+            if wrap:
+                rel_x = wrapped_delta(rel_x, self.screen_width)
+                rel_y = wrapped_delta(rel_y, self.screen_height)
+            move_x = (x1[:, k] - x0[:, k])[:, None] - target_vx * dt
+            move_y = (y1[:, k] - y0[:, k])[:, None] - target_vy * dt
+            t = time_of_impact(rel_x, rel_y, move_x, move_y, reach).min(axis=1, initial=np.inf)
+            best = np.where(valid[:, k], np.minimum(best, t), best)
+        return best
+    
+    def _update_asteroids(self, rows, dt):
+        """AsteroidField.update for the given rows."""
+        x = self.ax[rows] + self.avx[rows] * dt
+        y = self.ay[rows] + self.avy[rows] * dt
+        vx = self.avx[rows]
+        vy = self.avy[rows]
+        radius = self.radius[rows]
+        mass = self.mass[rows]
+        spin = self.rotation_speed[rows]
+        
+        # Screen wrapping (the field repeats every screen width and height)
+        x %= self.screen_width
+        y %= self.screen_height
+        
+        # Pairs overlapping before any is resolved, then resolved in (i, j) order
+        pairs = [(i, j) for i in range(self.asteroid_count) for j in range(i + 1, self.asteroid_count)]
+        overlapping = []
+        for i, j in pairs:
+            dx = wrapped_delta(x[:, j] - x[:, i], self.screen_width)
+            dy = wrapped_delta(y[:, j] - y[:, i], self.screen_height)
+            min_dist = radius[:, i] + radius[:, j]
+            overlapping.append(dx * dx + dy * dy < min_dist * min_dist)
+        
+        for (i, j), candidates in zip(pairs, overlapping):
+            if not candidates.any():
+                continue
+            # As AsteroidField._resolve_pair, on current positions
+            dx = wrapped_delta(x[:, j] - x[:, i], self.screen_width)
+            dy = wrapped_delta(y[:, j] - y[:, i], self.screen_height)
+            distance = np.sqrt(dx * dx + dy * dy)
+            min_dist = radius[:, i] + radius[:, j]
+            colliding = candidates & (distance < min_dist) & (distance > 0)
+            safe = np.where(colliding, distance, 1.0)
+            nx = np.where(colliding, dx / safe, 0.0)
+            ny = np.where(colliding, dy / safe, 0.0)
+            
+            # Elastic impulse only for pairs moving toward each other
+            dvn = (vx[:, i] - vx[:, j]) * nx + (vy[:, i] - vy[:, j]) * ny
+            approaching = colliding & (dvn > 0)
+            m1 = mass[:, i]
+            m2 = mass[:, j]
+            impulse = np.where(approaching, 2 * dvn / (m1 + m2), 0.0)
+            vx[:, i] -= impulse * m2 * nx
+            vy[:, i] -= impulse * m2 * ny
+            vx[:, j] += impulse * m1 * nx
+            vy[:, j] += impulse * m1 * ny
+            
+            # Spin on collision
+            jitter = self.rng.uniform(-0.3, 0.3, (len(rows), 2))
+            spin[:, i] += np.where(approaching, jitter[:, 0], 0.0)
+            spin[:, j] += np.where(approaching, jitter[:, 1], 0.0)
+            
+            # Separate overlapping asteroids
+            separation = np.where(colliding, (min_dist - distance) / 2 + 1, 0.0)
+            x[:, i] -= nx * separation
+            y[:, i] -= ny * separation
+            x[:, j] += nx * separation
+            y[:, j] += ny * separation
+        
+        self.ax[rows] = x
+        self.ay[rows] = y
+        self.avx[rows] = vx
+        self.avy[rows] = vy
+        self.rotation_speed[rows] = spin
+    
+    def _spawn_collectible(self, rows, attempts=100):
+        """Place targets for the given rows by rejection sampling (Collectible.spawn's
+        clearances): the first valid of attempts samples, else the last."""
+        n = len(rows)
+        if n == 0:
+            return
+        margin = 0.1
+        cx = self.rng.uniform(self.screen_width * margin, self.screen_width * (1 - margin), (n, attempts))
+        cy = self.rng.uniform(self.screen_height * margin, self.screen_height * (1 - margin), (n, attempts))
+        
+        # Far enough from the player...
+        min_distance = min(self.screen_width, self.screen_height) * 0.2
+        dx = cx - self.x[rows, None]
+        dy = cy - self.y[rows, None]
+        valid = dx * dx + dy * dy >= min_distance * min_distance
+        
+        # ...and from every asteroid
+        for k in range(self.asteroid_count):
+            dx = wrapped_delta(cx - self.ax[rows, k, None], self.screen_width)
+            dy = wrapped_delta(cy - self.ay[rows, k, None], self.screen_height)
+            clearance = self.radius[rows, k, None] + self.collectible_size + 20
+            valid &= dx * dx + dy * dy >= clearance * clearance
+        
+        choice = np.where(valid.any(axis=1), valid.argmax(axis=1), attempts - 1)
+        self.cx[rows] = cx[np.arange(n), choice]
+        self.cy[rows] = cy[np.arange(n), choice]
+    
+    def _respawn_asteroids(self, rows, min_distance, attempts=50):
+        """AsteroidField.respawn_away_from the (reset) player for the given rows."""
+        n = len(rows)
+        if n == 0:
+            return
+        shape = (n, self.asteroid_count, attempts)
+        ax = self.rng.uniform(0, self.screen_width, shape)
+        ay = self.rng.uniform(0, self.screen_height, shape)
+        dx = wrapped_delta(ax - self.x[rows, None, None], self.screen_width)
+        dy = wrapped_delta(ay - self.y[rows, None, None], self.screen_height)
+        valid = dx * dx + dy * dy > min_distance * min_distance
+        choice = np.where(valid.any(axis=2), valid.argmax(axis=2), attempts - 1)
+        self.ax[rows] = np.take_along_axis(ax, choice[..., None], axis=2)[..., 0]
+        self.ay[rows] = np.take_along_axis(ay, choice[..., None], axis=2)[..., 0]
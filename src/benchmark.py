@@ -0,0 +1,259 @@
+"""Benchmarks for the simulation and rendering hot paths (no display needed)."""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+
+# Headless: render to SDL's dummy video driver, discard audio
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import numpy as np
+from asteroid import AsteroidField
+from collectible import Collectible
+from stars import Starfield
+from swipe import SwipeProcessor
+from rng import RandomStreams
+from maze import Maze
+from game import Game
+
+
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+
+# A 4K maze of 20 px cells (about 20k), with a player small enough to fit them:
+# width, height, cell size, player radius
+LARGE_MAZE = (3840, 2160, 20, 10)
+
+
+def measure(name, params, operation, min_time=0.5, min_runs=10, per_op=1):
+    """Time operation() repeatedly. Returns a result row with ops/sec and percentiles.
+
+    per_op is how many operations one call performs (e.g. events per flood).
+    """
+    operation()  # Warm caches before timing
+    samples = []
+    start = time.perf_counter()
+    while len(samples) < min_runs or time.perf_counter() - start < min_time:
+        t0 = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - t0)
+    samples = np.array(samples)
+    p50, p95, p99 = np.percentile(samples, (50, 95, 99)) * 1000
+    row = {
+        'name': name,
+        'params': params,
+        'runs': len(samples),
+        'ops_per_sec': per_op / samples.mean(),
+        'mean_ms': samples.mean() * 1000,
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99,
+    }
+    print(f"{name:<28} {json.dumps(params):<22} {row['ops_per_sec']:>12.1f} ops/s  "
+          f"p50 {p50:8.3f} ms  p99 {p99:8.3f} ms")
+    return row
+
+
+def bench_asteroids(sizes, min_time):
+    """AsteroidField.update, the collision pass alone and a full respawn, by asteroid count."""
+    rows = []
+    for count in sizes:
+        field = AsteroidField(SCREEN_WIDTH, SCREEN_HEIGHT, count=count, streams=RandomStreams(count))
+        rows.append(measure('AsteroidField.update', {'asteroids': count},
+                            lambda: field.update(1.0 / 60), min_time))
+        rows.append(measure('resolve_asteroid_collisions', {'asteroids': count},
+                            field._resolve_asteroid_collisions, min_time))
+        rows.append(measure('respawn_away_from', {'asteroids': count},
+                            lambda: field.respawn_away_from(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, 150),
+                            min_time))
+    return rows
+
+
+def bench_spawn(sizes, min_time):
+    """Collectible.spawn against dense obstacle lists."""
+    rows = []
+    for count in sizes:
+        streams = RandomStreams(count)
+        field = AsteroidField(SCREEN_WIDTH, SCREEN_HEIGHT, count=count, streams=streams)
+        collectible = Collectible(SCREEN_WIDTH, SCREEN_HEIGHT, int(SCREEN_WIDTH * 0.03), streams)
+        rows.append(measure('Collectible.spawn', {'obstacles': count},
+                            lambda: collectible.spawn(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, field),
+                            min_time))
+        
+        # Worst case: every obstacle has moved into another free-space cell
+        def spawn_after_move():
+            field.x += collectible.free_space.cell_size
+            field.x %= SCREEN_WIDTH
+            collectible.spawn(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, field)
+        rows.append(measure('Collectible.spawn', {'obstacles': count, 'all_moved': True},
+                            spawn_after_move, min_time))
+    return rows
+
+
+def bench_starfield(screen, sizes, min_time):
+    """Starfield.draw by star count."""
+    rows = []
+    for count in sizes:
+        starfield = Starfield(SCREEN_WIDTH, SCREEN_HEIGHT, star_count=count, streams=RandomStreams(count))
+        frame = [0]
+        
+        def draw():
+            frame[0] += 16
+            starfield.draw(screen, frame[0], (frame[0] % SCREEN_WIDTH, 0))
+        rows.append(measure('Starfield.draw', {'stars': count}, draw, min_time))
+    return rows
+
+
+def bench_swipe(sizes, min_time):
+    """SwipeProcessor.end_swipe over long swipes."""
+    rows = []
+    for length in sizes:
+        processor = SwipeProcessor()
+        points = RandomStreams(length).numpy('swipe').integers(0, SCREEN_WIDTH, (length, 2)).tolist()
+        processor.start_swipe(*points[0])
+        for x, y in points[1:]:
+            processor.add_point(x, y)
+        
+        def end_swipe():
+            processor.is_swiping = True
+            processor.end_swipe()
+        rows.append(measure('SwipeProcessor.end_swipe', {'points': length}, end_swipe, min_time))
+    return rows
+
+
+def bench_maze(screen_sizes, min_time):
+    """Maze wall tests and target spawning by screen size at the default
+    cell size, and in the large 4K maze."""
+    rows = []
+    width, height, cell_size, player_radius = LARGE_MAZE
+    cases = [(w, h, None, None) for w, h in screen_sizes] + [(width, height, cell_size, player_radius)]
+    for width, height, cell_size, player_radius in cases:
+        streams = RandomStreams(1)
+        maze = Maze(width, height, streams.python('maze'), cell_size, player_radius)
+        collectible = Collectible(width, height, maze.player_radius, streams)
+        params = {'screen': f'{width}x{height}', 'cells': maze.rows * maze.cols}
+        # A short step from the start cell's centre toward its open neighbour
+        # (the carve opens one of the two): tests the nearby walls without hitting one
+        start_x, start_y = maze.start_position()
+        step_x, step_y = (5, 0) if maze.open[1, 2] else (0, 5)
+        segments = [(start_x, start_y, start_x + step_x, start_y + step_y)]
+        rows.append(measure('Maze.sweep_collision', params,
+                            lambda: maze.sweep_collision(segments, maze.player_radius), min_time))
+        rows.append(measure('Collectible.spawn_in_maze', params,
+                            lambda: collectible.spawn_in_maze(maze, start_x, start_y), min_time))
+    return rows
+
+
+def _playing_game(maze=False, large_maze=False):
+    """A Game past its title screen, mid-round (in the large 4K maze if large_maze)."""
+    if not large_maze:
+        game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, seed=1, maze=maze)
+        game.sim.skip_title()
+        return game
+    width, height, cell_size, player_radius = LARGE_MAZE
+    game = Game(width, height, seed=1, maze=True, maze_cell_size=cell_size)
+    # Shrink the player first, so the round's maze is carved at the fine cell size
+    game.sim.player.radius = player_radius
+    game.sim.skip_title()
+    return game
+
+
+def bench_events(sizes, min_time):
+    """Game.handle_event under floods of mouse-motion events (ops are events)."""
+    rows = []
+    game = _playing_game()
+    for count in sizes:
+        events = [pygame.event.Event(pygame.MOUSEMOTION, rel=(i % 7 - 3, i % 5 - 2), pos=(0, 0), buttons=(0, 0, 0))
+                  for i in range(count)]
+        
+        def flood():
+            for event in events:
+                game.handle_event(event)
+            game.pending_motion = [0, 0]
+            game.pending_events = 0
+        rows.append(measure('Game.handle_event', {'events': count}, flood, min_time, per_op=count))
+    game.cleanup()
+    return rows
+
+
+def bench_frame(screen, min_time):
+    """One full frame: Game.update, end_frame and Game.draw with thrust."""
+    rows = []
+    cases = [(maze, False, dirty_rects) for maze in (False, True) for dirty_rects in (False, True)]
+    cases += [(True, True, dirty_rects) for dirty_rects in (False, True)]
+    for maze, large_maze, dirty_rects in cases:
+        game = _playing_game(maze, large_maze)
+        game.dirty_rects = dirty_rects
+        # The large maze draws to an off-screen 4K surface
+        target = pygame.Surface((game.screen_width, game.screen_height)) if large_maze else screen
+        frame = [0]
+        
+        def run_frame():
+            frame[0] += 1
+            game.handle_event(pygame.event.Event(pygame.MOUSEMOTION, rel=(2, 1), pos=(0, 0), buttons=(0, 0, 0)))
+            game.update(1.0 / 60)
+            game.end_frame()
+            game.draw(target, frame[0] * 16)
+            # Keep the round going however long the benchmark runs
+            game.sim.time_remaining = game.sim.round_duration
+        params = {'maze': maze, 'dirty_rects': dirty_rects}
+        if large_maze:
+            params['cells'] = game.sim.maze.rows * game.sim.maze.cols
+        rows.append(measure('Game frame', params, run_frame, min_time))
+        game.cleanup()
+    return rows
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark simulation and rendering hot paths')
+    parser.add_argument('--output', default='benchmark.json',
+                        help='JSON results file (default benchmark.json)')
+    parser.add_argument('--quick', action='store_true',
+                        help='Shorter runs and smaller sizes, for a smoke check')
+    parser.add_argument('--only', metavar='NAME',
+                        help='Run only benchmarks whose group name contains NAME '
+                             '(asteroids, spawn, stars, swipe, events, maze, frame)')
+    args = parser.parse_args()
+    
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    min_time = 0.1 if args.quick else 0.5
+    groups = {
+        'asteroids': lambda: bench_asteroids([3, 30, 300] if args.quick else [3, 30, 300, 3000], min_time),
+        'spawn': lambda: bench_spawn([3, 30, 300] if args.quick else [3, 30, 300, 1000], min_time),
+        'stars': lambda: bench_starfield(screen, [100, 1000, 10000] if args.quick else [100, 1000, 10000, 100000],
+                                         min_time),
+        'swipe': lambda: bench_swipe([10, 1000, 100000], min_time),
+        'events': lambda: bench_events([10, 1000] if args.quick else [10, 1000, 10000], min_time),
+        'maze': lambda: bench_maze([(1024, 768), (1920, 1080), (3840, 2160)], min_time),
+        'frame': lambda: bench_frame(screen, min_time),
+    }
+    
+    results = []
+    for name, run in groups.items():
+        if args.only is None or args.only in name:
+            results.extend(run())
+    
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
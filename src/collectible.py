@@ -1,16 +1,19 @@
 """Collectible target with pulsing glow and spawn logic."""
-import random
-import pygame
 import math
+import pygame
+from collision import first_impact
+from rng import RandomStreams
+from spatial import OccupancyGrid
 
 
 class Collectible:
     """The pulsing collectible target - green diamond."""
     
-    def __init__(self, screen_width, screen_height, player_radius):
+    def __init__(self, screen_width, screen_height, player_radius, streams=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.player_radius = player_radius
+        self.rng = (streams or RandomStreams()).python('collectible')
         
         # Size (half-width of diamond)
         self.size = int(player_radius * 0.8)
@@ -22,102 +25,72 @@ class Collectible:
         # Pulsing animation
         self.pulse_phase = 0
         
-    def spawn(self, player_x, player_y, obstacles=None):
-        """Spawn at a random valid location, avoiding player and obstacles."""
-        # Safe zone: 10% margin from edges
+        # Spawn area (10% margin from edges) as a free-space grid
         margin = 0.1
-        min_x = self.screen_width * margin
-        max_x = self.screen_width * (1 - margin)
-        min_y = self.screen_height * margin
-        max_y = self.screen_height * (1 - margin)
+        self.free_space = OccupancyGrid(screen_width * margin, screen_height * margin,
+                                        screen_width * (1 - 2 * margin), screen_height * (1 - 2 * margin))
         
+        # False while no valid spawn location exists
+        self.active = False
+    
+    def spawn(self, player_x, player_y, obstacles=None):
+        """Spawn at a random valid location, avoiding player and obstacles.
+        
+        obstacles has x, y and radius arrays (an AsteroidField). Returns
+        False, and leaves the target inactive, if no valid location exists.
+        """
         # Minimum distance from player: 20% of screen
         min_distance = min(self.screen_width, self.screen_height) * 0.2
         
-        attempts = 0
-        while attempts < 100:
-            self.x = random.uniform(min_x, max_x)
-            self.y = random.uniform(min_y, max_y)
-            
-            # Check distance from player
-            dx = self.x - player_x
-            dy = self.y - player_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance < min_distance:
-                attempts += 1
-                continue
-            
-            # Check distance from obstacles
-            if obstacles:
-                too_close = False
-                for obs in obstacles:
-                    ox, oy = obs.get_position()
-                    dx = self.x - ox
-                    dy = self.y - oy
-                    dist = math.sqrt(dx * dx + dy * dy)
-                    if dist < obs.radius + self.size + 20:
-                        too_close = True
-                        break
-                if too_close:
-                    attempts += 1
-                    continue
-            
-            break
+        # Keep clear of obstacles by their radius plus some room
+        if obstacles is not None and len(obstacles):
+            self.free_space.update(obstacles.x, obstacles.y, obstacles.radius + self.size + 20)
+        else:
+            self.free_space.clear()
+        
+        position = self.free_space.sample(self.rng, (player_x, player_y, min_distance))
+        self.active = position is not None
+        if self.active:
+            self.x, self.y = position
+        return self.active
+    
+    def spawn_in_maze(self, maze, player_x, player_y):
+        """Spawn at the centre of an open maze cell a good way along the maze from the player."""
+        # Minimum path distance from player: 15% of screen
+        min_distance = min(self.screen_width, self.screen_height) * 0.15
+        self.x, self.y = maze.spawn_point(self.rng, player_x, player_y, min_distance)
+        self.active = True
+        return True
     
     def update(self, dt):
         """Update pulsing animation."""
         self.pulse_phase += dt * 3  # 3 radians per second
     
-    def draw(self, screen):
-        """Draw the collectible as a pulsing green diamond."""
-        # Oscillate size between 0.8 and 1.2
-        scale = 1.0 + 0.2 * math.sin(self.pulse_phase)
-        size = int(self.size * scale)
-        
-        # Diamond points (rotated square)
-        points = [
-            (self.x, self.y - size),      # Top
-            (self.x + size, self.y),       # Right
-            (self.x, self.y + size),       # Bottom
-            (self.x - size, self.y)        # Left
-        ]
-        
-        # Draw glow (larger, semi-transparent)
-        glow_size = int(size * 1.3)
-        glow_points = [
-            (self.x, self.y - glow_size),
-            (self.x + glow_size, self.y),
-            (self.x, self.y + glow_size),
-            (self.x - glow_size, self.y)
-        ]
-        glow_surface = pygame.Surface((glow_size * 3, glow_size * 3), pygame.SRCALPHA)
-        glow_color = (0, 255, 100, 80)
-        adjusted_points = [(p[0] - self.x + glow_size * 1.5, p[1] - self.y + glow_size * 1.5) for p in glow_points]
-        pygame.draw.polygon(glow_surface, glow_color, adjusted_points)
-        screen.blit(glow_surface, (self.x - glow_size * 1.5, self.y - glow_size * 1.5))
-        
-        # Draw main diamond
-        pygame.draw.polygon(screen, self.color, points)
-        
-        # Draw bright center
-        inner_size = int(size * 0.5)
-        inner_points = [
-            (self.x, self.y - inner_size),
-            (self.x + inner_size, self.y),
-            (self.x, self.y + inner_size),
-            (self.x - inner_size, self.y)
-        ]
-        pygame.draw.polygon(screen, (150, 255, 200), inner_points)
+    def draw(self, screen, atlas):
+        """Draw the collectible as a pulsing green diamond from the effect atlas.
+        Returns the rect drawn (empty while inactive)."""
+        if not self.active:
+            return pygame.Rect(self.x, self.y, 0, 0)
+        return atlas.draw_collectible(screen, self.x, self.y, self.pulse_phase)
     
     def check_collision(self, player_x, player_y, player_radius):
         """Check if player collects this target."""
+        if not self.active:
+            return False
         dx = self.x - player_x
         dy = self.y - player_y
         distance = math.sqrt(dx * dx + dy * dy)
         
         return distance < (self.size + player_radius)
     
+    def sweep_collision(self, segments, player_radius):
+        """Fraction of the step at which the player's swept path first
+        reaches this target, or None if it never does."""
+        if not self.active:
+            return None
+        return first_impact(segments, self.x, self.y, 0.0, 0.0,
+                            self.size + player_radius, 0.0)
+    
     def get_position(self):
         """Return current position as tuple."""
         return (self.x, self.y)
\ No newline at end of file
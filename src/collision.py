@@ -0,0 +1,55 @@
+"""Swept (continuous) circle collision tests."""
+import numpy as np
+from spatial import wrapped_delta
+
+
+def time_of_impact(rel_x, rel_y, move_x, move_y, reach):
+    """Earliest fraction t in [0, 1] at which two circles first touch.
+    
+    rel_x/rel_y is the mover's start position relative to the target,
+    move_x/move_y the relative motion over the step and reach the sum of
+    the radii. Works on scalars or arrays; returns inf where there is no
+    contact during the step.
+    """
+    rel_x, rel_y, move_x, move_y, reach = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (rel_x, rel_y, move_x, move_y, reach)))
+    
+    # Solve |rel + t * move|^2 = reach^2 for the smaller root
+    a = move_x * move_x + move_y * move_y
+    half_b = rel_x * move_x + rel_y * move_y
+    c = rel_x * rel_x + rel_y * rel_y - reach * reach
+    disc = half_b * half_b - a * c
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (-half_b - np.sqrt(np.maximum(disc, 0.0))) / a
+    hit = (a > 0) & (disc >= 0) & (t >= 0) & (t <= 1)
+    t = np.where(hit, t, np.inf)
+    
+    # Already overlapping at the start of the step
+    return np.where(c < 0, 0.0, t)
+
+
+def first_impact(segments, target_x, target_y, target_vx, target_vy, reach, dt, wrap=None):
+    """Earliest time of impact of a swept circle against moving targets.
+    
+    segments is a list of (x0, y0, x1, y1) paths the mover took during the
+    step (more than one when it wrapped across a screen edge). Targets end
+    the step at target_x/target_y having moved with target_vx/target_vy
+    over dt. wrap is the (width, height) of a screen the targets repeat
+    across, if they do: each is then tested at its copy nearest the
+    mover. Returns the fraction of the step, or None for no contact.
+    """
+    best = np.inf
+    for x0, y0, x1, y1 in segments:
+        # Mover start relative to target start, and relative motion
+        rel_x = x0 - (target_x - target_vx * dt)
+        rel_y = y0 - (target_y - target_vy * dt)
+        if wrap is not None:
+            rel_x = wrapped_delta(rel_x, wrap[0])
+            rel_y = wrapped_delta(rel_y, wrap[1])
+        move_x = (x1 - x0) - target_vx * dt
+        move_y = (y1 - y0) - target_vy * dt
+        t = time_of_impact(rel_x, rel_y, move_x, move_y, reach)
+        if t.size:
+            best = min(best, float(np.min(t)))
+    return None if best == np.inf else best
@@ -0,0 +1,185 @@
+"""Pre-rendered sprites for the collectible pulse and the thrust flame."""
+from collections import OrderedDict
+import math
+import pygame
+
+
+def flame_colors(magnitude):
+    """Get flame colors based on magnitude (energy). Blue=weak, Yellow=medium, Red=strong."""
+    # Normalize magnitude to 0-1 range (assuming max useful magnitude around 15)
+    t = min(1.0, magnitude / 15.0)
+    
+    if t < 0.5:
+        # Blue to Yellow (low to medium energy)
+        # Blue: (100, 150, 255) -> Yellow: (255, 255, 0)
+        inner_t = t * 2  # 0 to 1 within this range
+        outer = (int(100 + 155 * inner_t), int(150 + 105 * inner_t), int(255 - 255 * inner_t))
+        middle = (int(150 + 105 * inner_t), int(200 + 55 * inner_t), int(255 - 205 * inner_t))
+        core = (int(200 + 55 * inner_t), int(250 + 5 * inner_t), int(255 - 155 * inner_t))
+    else:
+        # Yellow to Red (medium to high energy)
+        # Yellow: (255, 255, 0) -> Red: (255, 50, 0)
+        inner_t = (t - 0.5) * 2  # 0 to 1 within this range
+        outer = (255, int(255 - 205 * inner_t), 0)
+        middle = (255, int(255 - 105 * inner_t), int(50 - 50 * inner_t))
+        core = (255, int(255 - 55 * inner_t), int(100 - 100 * inner_t))
+    
+    return outer, middle, core
+
+
+def flame_polygons(dx, dy):
+    """Outer, middle and core flame triangles for a thrust vector.
+    
+    Points are relative to the flame tip (the ball edge); the flame extends
+    backward, away from the thrust direction.
+    """
+    magnitude = math.sqrt(dx * dx + dy * dy)
+    
+    # Normalize direction (thrust points in direction of motion)
+    norm_dx = dx / magnitude
+    norm_dy = dy / magnitude
+    
+    # Thrust length based on magnitude
+    thrust_length = min(100, max(15, magnitude * 8))
+    
+    # Base of flame (behind the ball)
+    base_x = -norm_dx * thrust_length
+    base_y = -norm_dy * thrust_length
+    base_width = min(20, thrust_length * 0.5)
+    
+    # Perpendicular vector for width
+    perp_x = -norm_dy
+    perp_y = norm_dx
+    
+    # Outer flame
+    outer = [
+        (base_x + perp_x * base_width / 2, base_y + perp_y * base_width / 2),
+        (base_x - perp_x * base_width / 2, base_y - perp_y * base_width / 2),
+        (0.0, 0.0)
+    ]
+    
+    # Middle flame
+    inner_width = base_width * 0.6
+    inner_base_x = base_x + norm_dx * thrust_length * 0.15
+    inner_base_y = base_y + norm_dy * thrust_length * 0.15
+    middle = [
+        (inner_base_x + perp_x * inner_width / 2, inner_base_y + perp_y * inner_width / 2),
+        (inner_base_x - perp_x * inner_width / 2, inner_base_y - perp_y * inner_width / 2),
+        (0.0, 0.0)
+    ]
+    
+    # Hot core
+    core_width = base_width * 0.25
+    core_base_x = base_x + norm_dx * thrust_length * 0.3
+    core_base_y = base_y + norm_dy * thrust_length * 0.3
+    core_tip_x = base_x + norm_dx * thrust_length * 0.75
+    core_tip_y = base_y + norm_dy * thrust_length * 0.75
+    core = [
+        (core_base_x + perp_x * core_width / 2, core_base_y + perp_y * core_width / 2),
+        (core_base_x - perp_x * core_width / 2, core_base_y - perp_y * core_width / 2),
+        (core_tip_x, core_tip_y)
+    ]
+    
+    return outer, middle, core
+
+
+class EffectAtlas:
+    """Sprites for per-frame effects, rendered once and drawn with a blit.
+    
+    Collectible pulse frames are built at startup, quantized over the sine
+    phase. Flame sprites are quantized by magnitude and angle and rendered
+    on first use into a bounded LRU cache.
+    """
+    
+    PULSE_FRAMES = 32
+    FLAME_MAGNITUDE_STEP = 0.5
+    FLAME_MAX_MAGNITUDE = 15.0  # Colors and length stop changing past this
+    FLAME_ANGLES = 64
+    
+    def __init__(self, collectible_size, max_flames=256):
+        self.collectible_size = collectible_size
+        self.max_flames = max_flames
+        
+        # Pulse frames share a sprite whenever they round to the same size
+        sprites = {}
+        self.pulse_frames = []
+        for i in range(self.PULSE_FRAMES):
+            scale = 1.0 + 0.2 * math.sin(2 * math.pi * i / self.PULSE_FRAMES)
+            size = int(collectible_size * scale)
+            if size not in sprites:
+                sprites[size] = self._render_collectible(size)
+            self.pulse_frames.append(sprites[size])
+        
+        self.flames = OrderedDict()
+    
+    def _render_collectible(self, size):
+        """Glow, diamond and bright centre for one pulse size, centred in the sprite."""
+        glow_size = int(size * 1.3)
+        extent = glow_size * 3
+        center = extent / 2
+        surface = pygame.Surface((extent, extent), pygame.SRCALPHA)
+        
+        def diamond(half_width):
+            return [
+                (center, center - half_width),  # Top
+                (center + half_width, center),  # Right
+                (center, center + half_width),  # Bottom
+                (center - half_width, center)  # Left
+            ]
+        
+        # Glow (larger, semi-transparent), main diamond and bright centre
+        pygame.draw.polygon(surface, (0, 255, 100, 80), diamond(glow_size))
+        pygame.draw.polygon(surface, (0, 255, 100), diamond(size))
+        pygame.draw.polygon(surface, (150, 255, 200), diamond(int(size * 0.5)))
+        return surface
+    
+    def draw_collectible(self, screen, x, y, pulse_phase):
+        """Blit the pulse frame nearest this phase centred on (x, y). Returns its rect."""
+        frame = int(round(pulse_phase / (2 * math.pi) * self.PULSE_FRAMES)) % self.PULSE_FRAMES
+        sprite = self.pulse_frames[frame]
+        half = sprite.get_width() / 2
+        return screen.blit(sprite, (x - half, y - half))
+    
+    def _flame_sprite(self, magnitude_index, angle_index):
+        """Cached flame sprite and the offset of its top-left from the tip."""
+        key = (magnitude_index, angle_index)
+        entry = self.flames.get(key)
+        if entry is not None:
+            self.flames.move_to_end(key)
+            return entry
+        
+        magnitude = magnitude_index * self.FLAME_MAGNITUDE_STEP
+        angle = 2 * math.pi * angle_index / self.FLAME_ANGLES
+        polygons = flame_polygons(magnitude * math.cos(angle), magnitude * math.sin(angle))
+        
+        # Crop the sprite to the flame's bounding box
+        xs = [p[0] for polygon in polygons for p in polygon]
+        ys = [p[1] for polygon in polygons for p in polygon]
+        left, top = math.floor(min(xs)) - 1, math.floor(min(ys)) - 1
+        width, height = math.ceil(max(xs)) + 2 - left, math.ceil(max(ys)) + 2 - top
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for polygon, color in zip(polygons, flame_colors(magnitude)):
+            pygame.draw.polygon(surface, color, [(px - left, py - top) for px, py in polygon])
+        
+        entry = (surface, left, top)
+        self.flames[key] = entry
+        if len(self.flames) > self.max_flames:
+            self.flames.popitem(last=False)
+        return entry
+    
+    def draw_thrust(self, screen, ball_x, ball_y, dx, dy, ball_radius):
+        """Blit a rocket thrust flame behind the ball, pointing in thrust direction.
+        Returns the rect drawn, or None if there was no flame."""
+        magnitude = math.sqrt(dx * dx + dy * dy)
+        
+        if magnitude < 0.1:
+            return None
+        
+        # Tip of flame is at ball edge, opposite to the thrust direction
+        tip_x = ball_x - dx / magnitude * ball_radius
+        tip_y = ball_y - dy / magnitude * ball_radius
+        
+        magnitude_index = max(1, round(min(magnitude, self.FLAME_MAX_MAGNITUDE) / self.FLAME_MAGNITUDE_STEP))
+        angle_index = round(math.atan2(dy, dx) / (2 * math.pi) * self.FLAME_ANGLES) % self.FLAME_ANGLES
+        surface, left, top = self._flame_sprite(magnitude_index, angle_index)
+        return screen.blit(surface, (tip_x + left, tip_y + top))
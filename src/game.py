@@ -1,335 +1,310 @@
 """Game state, collision detection, and score management."""
 import pygame
 import math
-from player import Player
-from collectible import Collectible
-from swipe import SwipeProcessor
+from simulation import Simulation
 from input import InputHandler
 from audio import AudioManager
 from ui import UI
 from stars import Starfield
-from asteroid import AsteroidField
+from effects import EffectAtlas
+from profiler import FrameProfiler
 
 
 class Game:
-    """Main game state and logic."""
+    """Window layer: input, mouse capture, audio and rendering around a Simulation."""
     
-    def __init__(self, screen_width, screen_height, dev_mode=False):
+    def __init__(self, screen_width, screen_height, dev_mode=False, dirty_rects=False, seed=None,
+                 maze=False, maze_cell_size=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.dev_mode = dev_mode
         self.round_duration = 10.0 if dev_mode else 60.0
         
-        # Game objects
-        self.player = Player(screen_width, screen_height)
-        self.collectible = Collectible(screen_width, screen_height, self.player.radius)
-        self.swipe_processor = SwipeProcessor()
-        self.input_handler = InputHandler(self.swipe_processor)
+        # Simulation core (player, collectible, asteroids, score, timer)
+        self.sim = Simulation(screen_width, screen_height, round_duration=self.round_duration, seed=seed,
+                              maze=maze, maze_cell_size=maze_cell_size)
+        
+        # Presentation and input
+        self.input_handler = InputHandler(self.sim.swipe_processor)
         self.audio_manager = AudioManager()
         self.ui = UI(screen_width, screen_height)
-        self.starfield = Starfield(screen_width, screen_height)
-        self.asteroid_field = AsteroidField(screen_width, screen_height, count=3)
+        self.starfield = Starfield(screen_width, screen_height, streams=self.sim.streams)
+        self.effects = EffectAtlas(self.sim.collectible.size)
+        
+        # Maze walls, pre-rendered into one surface per maze
+        self.walls = None
+        self.walls_maze = None
+        self.wall_rng = self.sim.streams.python('maze_walls')
         
-        # Score
-        self.score = 0
-        self.level = 0
-        self.targets_per_level = 5
-        self.level_targets_collected = 0
+        # Per-phase frame timing (F3 shows the overlay)
+        self.profiler = FrameProfiler()
+        self.sim.profiler = self.profiler
         
-        # Timer (60 seconds per round, or 10 in dev mode)
-        self.time_remaining = self.round_duration
+        # Dirty-rect rendering: redraw and present only what moved
+        self.dirty_rects = dirty_rects
+        self.background = None
+        self.background_maze = None
+        self.previous_rects = None
         
-        # Game state: 'title', 'playing', 'transition'
-        self.game_state = 'title'
-        self.title_start_time = None
+        # Ticks run since the last rendered frame (input is released per frame)
+        self.frame_ticks = 0
         
-        # Continuous thrust state
-        self.is_thrusting = False
-        self.current_thrust = (0, 0)  # Current frame's thrust vector
-        self.thrust_history = []  # Recent thrust directions for smoothing
+        # Star parallax camera: the player's travel summed tick by tick, so
+        # wrapping and resets don't make the stars jump
+        self.camera = (0.0, 0.0)
+        self.camera_step = (0.0, 0.0)
+        
+        # Mouse motion summed over all of a frame's events, and how many moved
+        self.pending_motion = [0, 0]
+        self.pending_events = 0
         
         # Mouse capture state (start visible for title screen)
         self.mouse_captured = False
         pygame.mouse.set_visible(True)
         pygame.event.set_grab(False)
-        
-        # Spawn first collectible (avoiding asteroids)
-        player_x, player_y = self.player.get_position()
-        self.collectible.spawn(player_x, player_y, self.asteroid_field.get_asteroids())
     
     def handle_event(self, event):
         """Handle input events."""
+        # F3 toggles the frame profiler overlay on any screen
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle()
+            return
+        
         # Title screen - auto-advance after 1 second
-        if self.game_state == 'title':
+        if self.sim.game_state == 'title':
             return
         
         # Handle transition screen clicks
-        if self.game_state == 'transition' and event.type == pygame.MOUSEBUTTONDOWN:
+        if self.sim.game_state == 'transition' and event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 result = self.ui.check_transition_click(event.pos)
                 if result:
                     param_name, delta = result
-                    params = self.swipe_processor.get_parameters()
-                    new_value = params[param_name] + delta
-                    self.swipe_processor.set_parameter(param_name, new_value)
                     # Start new round
-                    self.game_state = 'playing'
-                    self.time_remaining = self.round_duration
-                    self.level_targets_collected = 0
-                    # Reset player velocity
-                    self.player.vx = 0
-                    self.player.vy = 0
-                    # Hide mouse and capture
-                    self.mouse_captured = True
-                    pygame.mouse.set_visible(False)
-                    pygame.event.set_grab(True)
+                    self.sim.choose_adjustment(param_name, delta)
+                    self._set_mouse_captured(True)
             return
         
         # Escape key to toggle mouse capture
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                self.mouse_captured = not self.mouse_captured
-                pygame.mouse.set_visible(not self.mouse_captured)
-                pygame.event.set_grab(self.mouse_captured)
+                self._set_mouse_captured(not self.mouse_captured)
                 return
         
         # Keyboard input for parameters
         self.input_handler.handle_event(event)
         
-        # Continuous thrust from mouse motion
-        if event.type == pygame.MOUSEMOTION:
-            rel_x, rel_y = event.rel
-            
-            # Only thrust if there's actual movement
-            if rel_x != 0 or rel_y != 0:
-                self.is_thrusting = True
-                
-                # Add to history
-                self.thrust_history.append((rel_x, rel_y))
-                
-                # Get smoothness parameter (1-10 maps to 10-100 samples to average)
-                params = self.swipe_processor.get_parameters()
-                smooth_samples = params['smoothness'] * 10
-                smooth_count = max(1, min(smooth_samples, len(self.thrust_history)))
-                
-                # Average over the last 'smooth_count' samples
-                recent = self.thrust_history[-smooth_count:]
-                avg_dx = sum(t[0] for t in recent) / len(recent)
-                avg_dy = sum(t[1] for t in recent) / len(recent)
-                
-                # Apply strength multiplier (0.1x to 1.0x)
-                multiplier = 0.1 + (params['strength'] / 10) * 0.9
-                
-                # Scale down for continuous application
-                continuous_scale = 0.5
-                
-                self.current_thrust = (avg_dx * multiplier * continuous_scale, 
-                                       avg_dy * multiplier * continuous_scale)
-                
-                # Keep history reasonable size (up to 100 for max smoothness)
-                if len(self.thrust_history) > 100:
-                    self.thrust_history = self.thrust_history[-100:]
+        # Continuous thrust from mouse motion, coalesced into one delta per frame
+        if event.type == pygame.MOUSEMOTION and self.sim.game_state == 'playing':
+            self.pending_motion[0] += event.rel[0]
+            self.pending_motion[1] += event.rel[1]
+            # Events without movement never counted as thrust samples
+            if event.rel[0] or event.rel[1]:
+                self.pending_events += 1
+    
+    def _set_mouse_captured(self, captured):
+        """Hide and grab the mouse while playing, release it on menus."""
+        self.mouse_captured = captured
+        pygame.mouse.set_visible(not captured)
+        pygame.event.set_grab(captured)
     
     def update(self, dt):
-        """Update game state."""
-        # Title screen - auto-advance after 1 second
-        if self.game_state == 'title':
-            if self.title_start_time is None:
-                self.title_start_time = pygame.time.get_ticks()
-            elif pygame.time.get_ticks() - self.title_start_time > 1000:
-                # Advance to playing
-                self.game_state = 'playing'
-                self.level = 1
-                self.time_remaining = self.round_duration
-                # Reset player velocity
-                self.player.vx = 0
-                self.player.vy = 0
-                # Hide mouse and capture
-                self.mouse_captured = True
-                pygame.mouse.set_visible(False)
-                pygame.event.set_grab(True)
-            return
-        
-        # Skip game updates during transition screen
-        if self.game_state == 'transition':
-            return
-        
+        """Advance the game by one fixed tick of dt seconds."""
         # Update input handler for key holding
-        self.input_handler.update()
-        
-        # Update timer
-        self.time_remaining -= dt
-        if self.time_remaining <= 0:
-            self.time_remaining = 0
-            # Round over - go to transition screen
-            self.game_state = 'transition'
-            self.level += 1
-            # Show mouse for transition screen
-            self.mouse_captured = False
-            pygame.mouse.set_visible(True)
-            pygame.event.set_grab(False)
-            return
-        
-        # Apply continuous thrust
-        if self.is_thrusting and (self.current_thrust[0] != 0 or self.current_thrust[1] != 0):
-            self.player.apply_impulse(self.current_thrust[0], self.current_thrust[1])
-        
-        # Reset thrust state - will be set again on next mouse motion
-        # Clear thrust so flame disappears when not actively thrusting
-        if not self.is_thrusting:
-            self.current_thrust = (0, 0)
-            self.thrust_history = []
-        self.is_thrusting = False
-        
-        # Update player
-        self.player.update(dt)
-        
-        # Update asteroids
-        self.asteroid_field.update(dt)
-        
-        # Update collectible animation
-        self.collectible.update(dt)
-        
-        # Check collision with collectible
-        player_x, player_y = self.player.get_position()
-        if self.collectible.check_collision(player_x, player_y, self.player.radius):
-            # Collected!
-            self.score += 1
-            self.level_targets_collected += 1
-            self.audio_manager.play_collection_sound()
-            self.collectible.spawn(player_x, player_y, self.asteroid_field.get_asteroids())
-        
-        # Check collision with asteroids
-        if self.asteroid_field.check_collision(player_x, player_y, self.player.radius):
-            # Hit asteroid - reset player and lose points
-            self.player.reset()
-            self.score = max(0, self.score - 1)
-            # Respawn asteroids away from player
-            new_x, new_y = self.player.get_position()
-            self.asteroid_field.respawn_away_from(new_x, new_y, 150)
+        if self.sim.game_state == 'playing':
+            self.input_handler.update()
+        
+        # The frame's coalesced mouse motion feeds thrust once (as its mean
+        # event, weighted by the event count), and the thrust stays on for
+        # every tick of the frame
+        if self.pending_events:
+            events = self.pending_events
+            self.sim.add_motion(self.pending_motion[0] / events, self.pending_motion[1] / events, events)
+            self.pending_motion = [0, 0]
+            self.pending_events = 0
+        self.frame_ticks += 1
+        was_playing = self.sim.game_state == 'playing'
+        events = self.sim.step(dt, release_input=False)
+        self._move_camera(was_playing and self.sim.game_state == 'playing')
+        for event in events:
+            if event == 'round_start':
+                # Hide mouse and capture
+                self._set_mouse_captured(True)
+            elif event == 'round_over':
+                # Show mouse for transition screen
+                self._set_mouse_captured(False)
+            elif event == 'collect':
+                self.audio_manager.play_collection_sound(pan=self._player_pan())
+            elif event == 'hit':
+                self.audio_manager.play_hit_sound(pan=self._player_pan())
     
-    def _get_flame_colors(self, magnitude):
-        """Get flame colors based on magnitude (energy). Blue=weak, Yellow=medium, Red=strong."""
-        # Normalize magnitude to 0-1 range (assuming max useful magnitude around 15)
-        t = min(1.0, magnitude / 15.0)
-        
-        if t < 0.5:
-            # Blue to Yellow (low to medium energy)
-            # Blue: (100, 150, 255) -> Yellow: (255, 255, 0)
-            inner_t = t * 2  # 0 to 1 within this range
-            outer = (int(100 + 155 * inner_t), int(150 + 105 * inner_t), int(255 - 255 * inner_t))
-            middle = (int(150 + 105 * inner_t), int(200 + 55 * inner_t), int(255 - 205 * inner_t))
-            core = (int(200 + 55 * inner_t), int(250 + 5 * inner_t), int(255 - 155 * inner_t))
+    def _move_camera(self, moved):
+        """Add the last tick's player displacement to the camera.
+        
+        The first motion segment is the whole step before any wrap, and a
+        reset leaves none, so neither moves the camera.
+        """
+        segments = self.sim.player.motion_segments
+        if moved and segments:
+            start_x, start_y, end_x, end_y = segments[0]
+            self.camera_step = (end_x - start_x, end_y - start_y)
         else:
-            # Yellow to Red (medium to high energy)
-            # Yellow: (255, 255, 0) -> Red: (255, 50, 0)
-            inner_t = (t - 0.5) * 2  # 0 to 1 within this range
-            outer = (255, int(255 - 205 * inner_t), 0)
-            middle = (255, int(255 - 105 * inner_t), int(50 - 50 * inner_t))
-            core = (255, int(255 - 55 * inner_t), int(100 - 100 * inner_t))
-        
-        return outer, middle, core
+            self.camera_step = (0.0, 0.0)
+        self.camera = (self.camera[0] + self.camera_step[0], self.camera[1] + self.camera_step[1])
     
-    def _draw_thrust(self, screen, ball_x, ball_y, dx, dy, ball_radius):
-        """Draw a rocket thrust flame behind the ball, pointing in thrust direction."""
-        magnitude = math.sqrt(dx * dx + dy * dy)
-        
-        if magnitude < 0.1:
-            return
-        
-        # Normalize direction (thrust points in direction of motion)
-        norm_dx = dx / magnitude
-        norm_dy = dy / magnitude
-        
-        # Thrust comes from behind the ball (opposite to motion direction)
-        # Tip of flame is at ball edge, base extends backward
-        tip_x = ball_x - norm_dx * ball_radius
-        tip_y = ball_y - norm_dy * ball_radius
-        
-        # Thrust length based on magnitude
-        thrust_length = min(100, max(15, magnitude * 8))
-        
-        # Base of flame (behind the ball)
-        base_x = tip_x - norm_dx * thrust_length
-        base_y = tip_y - norm_dy * thrust_length
-        base_width = min(20, thrust_length * 0.5)
-        
-        # Perpendicular vector for width
-        perp_x = -norm_dy
-        perp_y = norm_dx
-        
-        # Get colors based on magnitude (energy level)
-        outer_color, middle_color, core_color = self._get_flame_colors(magnitude)
-        
-        # Outer flame
-        pygame.draw.polygon(screen, outer_color, [
-            (base_x + perp_x * base_width / 2, base_y + perp_y * base_width / 2),
-            (base_x - perp_x * base_width / 2, base_y - perp_y * base_width / 2),
-            (tip_x, tip_y)
-        ])
-        
-        # Middle flame
-        inner_width = base_width * 0.6
-        inner_base_x = base_x + norm_dx * thrust_length * 0.15
-        inner_base_y = base_y + norm_dy * thrust_length * 0.15
-        pygame.draw.polygon(screen, middle_color, [
-            (inner_base_x + perp_x * inner_width / 2, inner_base_y + perp_y * inner_width / 2),
-            (inner_base_x - perp_x * inner_width / 2, inner_base_y - perp_y * inner_width / 2),
-            (tip_x, tip_y)
-        ])
-        
-        # Hot core
-        core_width = base_width * 0.25
-        core_base_x = base_x + norm_dx * thrust_length * 0.3
-        core_base_y = base_y + norm_dy * thrust_length * 0.3
-        core_tip_x = base_x + norm_dx * thrust_length * 0.75
-        core_tip_y = base_y + norm_dy * thrust_length * 0.75
-        pygame.draw.polygon(screen, core_color, [
-            (core_base_x + perp_x * core_width / 2, core_base_y + perp_y * core_width / 2),
-            (core_base_x - perp_x * core_width / 2, core_base_y - perp_y * core_width / 2),
-            (core_tip_x, core_tip_y)
-        ])
+    def end_frame(self):
+        """Finish a rendered frame: release this frame's thrust input.
+        
+        Frames that ran no tick keep their input for the next frame's ticks.
+        """
+        if self.sim.game_state != 'playing':
+            # No hum on the title and transition screens
+            self.audio_manager.set_thrust(0, self._player_pan())
+        elif self.frame_ticks:
+            # Thrust hum follows this frame's thrust (15 is full flame)
+            thrust_x, thrust_y = self.sim.current_thrust
+            magnitude = math.sqrt(thrust_x * thrust_x + thrust_y * thrust_y) / 15.0
+            self.audio_manager.set_thrust(magnitude, self._player_pan())
+        
+        if self.frame_ticks:
+            self.sim.release_input()
+            self.frame_ticks = 0
+    
+    def static_screen_timeout(self):
+        """How long the main loop may block waiting for input, in ms.
+        
+        None while the game is animating. On the transition screen nothing
+        changes until the player clicks, so 0 (wait indefinitely); on the
+        title screen, the time left before it advances.
+        """
+        if self.sim.game_state == 'transition':
+            return 0
+        if self.sim.game_state == 'title':
+            remaining = self.sim.title_duration - self.sim.title_elapsed
+            return max(1, int(remaining * 1000))
+        return None
     
-    def draw(self, screen, time_ms):
-        """Draw everything."""
-        # Background
-        screen.fill((0, 0, 0))  # Pure black
+    def _player_pan(self):
+        """Stereo pan (0 left to 1 right) from the player's x position."""
+        return max(0.0, min(1.0, self.sim.player.x / self.screen_width))
+    
+    def draw(self, screen, time_ms, alpha=1.0):
+        """Draw everything, blending moving objects alpha of the way into the next tick.
         
+        Returns the list of screen rects that changed in dirty-rect mode, or
+        None when the whole screen should be presented.
+        """
         # Title screen
-        if self.game_state == 'title':
+        if self.sim.game_state == 'title':
             self.ui.draw_title_screen(screen)
-            return
+            self.profiler.draw(screen)
+            self.previous_rects = None
+            return None
         
         # If in transition, show transition screen
-        if self.game_state == 'transition':
-            params = self.swipe_processor.get_parameters()
-            self.ui.draw_level_transition(screen, self.level - 1, params)
-            return
-        
-        # Stars
-        self.starfield.draw(screen, time_ms)
+        if self.sim.game_state == 'transition':
+            params = self.sim.swipe_processor.get_parameters()
+            self.ui.draw_level_transition(screen, self.sim.level - 1, params)
+            self.profiler.draw(screen)
+            self.previous_rects = None
+            return None
+        
+        # Get player position (blended between ticks)
+        player_x, player_y = self.sim.player.render_position(alpha)
+        
+        if not self.dirty_rects:
+            # Background
+            screen.fill((0, 0, 0))  # Pure black
+            
+            # Stars (parallax layers follow the camera, blended like the player)
+            camera = (self.camera[0] - self.camera_step[0] * (1 - alpha),
+                      self.camera[1] - self.camera_step[1] * (1 - alpha))
+            self.starfield.draw(screen, time_ms, camera)
+            self.profiler.lap('draw.stars')
+            
+            # Maze walls, one blit
+            if self.sim.maze is not None:
+                screen.blit(self._get_walls(screen), (0, 0))
+                self.profiler.lap('draw.maze')
+            
+            self._draw_entities(screen, player_x, player_y, alpha)
+            return None
+        
+        # Dirty-rect mode: the background (with a still starfield) is drawn
+        # once; each frame only last frame's entity rects are restored
+        background = self._get_background(screen, time_ms)
+        screen_rect = screen.get_rect()
+        if self.previous_rects is None:
+            screen.blit(background, (0, 0))
+        else:
+            for rect in self.previous_rects:
+                screen.blit(background, rect, rect)
+        
+        rects = [rect.clip(screen_rect) for rect in self._draw_entities(screen, player_x, player_y, alpha)]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        dirty = None if self.previous_rects is None else self.previous_rects + rects
+        self.previous_rects = rects
+        return dirty
+    
+    def _get_background(self, screen, time_ms):
+        """Black background with a still starfield (and any maze walls), for dirty-rect mode."""
+        if self.background is None or self.background_maze is not self.sim.maze:
+            self.background = screen.copy()
+            self.background.fill((0, 0, 0))
+            self.starfield.draw(self.background, time_ms)
+            if self.sim.maze is not None:
+                self.background.blit(self._get_walls(screen), (0, 0))
+            self.background_maze = self.sim.maze
+        return self.background
+    
+    def _get_walls(self, screen):
+        """The current maze's walls on a colour-keyed surface, rendered once per maze."""
+        if self.walls_maze is not self.sim.maze:
+            # Colour-keyed: walls are never pure black, and RLE blits skip the gaps fast
+            self.walls = pygame.Surface(screen.get_size())
+            if pygame.display.get_surface() is not None:
+                self.walls = self.walls.convert()
+            self.walls.fill((0, 0, 0))
+            self.sim.maze.render_walls(self.walls, self.wall_rng)
+            self.walls.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            self.walls_maze = self.sim.maze
+        return self.walls
+    
+    def _draw_entities(self, screen, player_x, player_y, alpha):
+        """Draw the moving objects and HUD. Returns the rects drawn."""
+        rects = []
         
         # Asteroids
-        self.asteroid_field.draw(screen)
+        self.profiler.lap('draw')
+        rects.extend(self.sim.asteroid_field.draw(screen, alpha))
+        self.profiler.lap('draw.asteroids')
         
         # Collectible
-        self.collectible.draw(screen)
-        
-        # Get player position
-        player_x, player_y = self.player.get_position()
+        rects.append(self.sim.collectible.draw(screen, self.effects))
+        self.profiler.lap('draw.collectible')
         
         # Draw thrust flame (behind ball, while thrusting)
-        if self.current_thrust[0] != 0 or self.current_thrust[1] != 0:
-            self._draw_thrust(screen, player_x, player_y, 
-                            self.current_thrust[0], self.current_thrust[1],
-                            self.player.radius)
+        if self.sim.current_thrust[0] != 0 or self.sim.current_thrust[1] != 0:
+            flame = self.effects.draw_thrust(screen, player_x, player_y,
+                                             self.sim.current_thrust[0], self.sim.current_thrust[1],
+                                             self.sim.player.radius)
+            if flame is not None:
+                rects.append(flame)
         
         # Player (draw after thrust so ball is on top)
-        self.player.draw(screen)
+        rects.append(self.sim.player.draw(screen, (player_x, player_y)))
+        self.profiler.lap('draw.player')
         
         # UI
-        params = self.swipe_processor.get_parameters()
-        self.ui.draw(screen, self.score, self.time_remaining, params)
+        params = self.sim.swipe_processor.get_parameters()
+        rects.extend(self.ui.draw(screen, self.sim.score, self.sim.time_remaining, params))
+        
+        # Profiler overlay on top of everything
+        overlay = self.profiler.draw(screen)
+        if overlay is not None:
+            rects.append(overlay)
+        self.profiler.lap('draw.ui')
+        return rects
     
     def cleanup(self):
         """Clean up resources."""
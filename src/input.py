@@ -1,7 +1,50 @@
-"""Keyboard handling for parameter adjustments."""
+"""Keyboard handling for parameter adjustments and mouse-motion smoothing."""
 import pygame
 
 
+class MotionWindow:
+    """Fixed-size ring buffer of motion samples with running sums.
+    
+    The buffer stores prefix sums rather than samples, so the mean of the
+    last n samples is two subtractions for any n up to the capacity.
+    """
+    
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        # prefix[k % slots] holds the sum of the first k samples
+        self.slots = capacity + 1
+        self.prefix_x = [0] * self.slots
+        self.prefix_y = [0] * self.slots
+        self.count = 0
+    
+    def __len__(self):
+        return min(self.count, self.capacity)
+    
+    def push(self, dx, dy, repeat=1):
+        """Add a sample (repeat times), overwriting the oldest once full."""
+        # Copies beyond the capacity would only overwrite each other
+        for _ in range(min(repeat, self.capacity)):
+            last = self.count % self.slots
+            self.count += 1
+            slot = self.count % self.slots
+            self.prefix_x[slot] = self.prefix_x[last] + dx
+            self.prefix_y[slot] = self.prefix_y[last] + dy
+    
+    def mean(self, n):
+        """Mean (dx, dy) of the most recent n samples (clamped to what's held)."""
+        n = max(1, min(n, len(self)))
+        end = self.count % self.slots
+        start = (self.count - n) % self.slots
+        return ((self.prefix_x[end] - self.prefix_x[start]) / n,
+                (self.prefix_y[end] - self.prefix_y[start]) / n)
+    
+    def clear(self):
+        """Drop all samples."""
+        self.count = 0
+        self.prefix_x[0] = 0
+        self.prefix_y[0] = 0
+
+
 class InputHandler:
     """Handles keyboard input for parameter adjustments."""
     
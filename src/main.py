@@ -3,6 +3,9 @@ import pygame
 import sys
 import argparse
 from game import Game
+from autopilot import Autopilot
+from maze import maze_player_radius, min_cell_size
+from replay import Recording, start_recording, replay
 
 
 def main():
@@ -10,31 +13,124 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Swipey - The parameter optimization simulator')
     parser.add_argument('--dev', action='store_true', help='Development mode (10 second rounds)')
+    parser.add_argument('--tick-rate', type=int, default=60, choices=[30, 60, 120, 240],
+                        help='Physics ticks per second (default 60)')
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help='Redraw and present only the screen regions that changed')
+    parser.add_argument('--fps', type=int, default=60,
+                        help='Display frame rate cap, independent of the tick rate (default 60)')
+    parser.add_argument('--seed', type=int,
+                        help='World seed (0 or more), for reproducible asteroids, targets and stars (default random)')
+    parser.add_argument('--maze', action='store_true',
+                        help='Maze mode: steer through a new maze each round instead of dodging asteroids')
+    parser.add_argument('--maze-cell', type=int, metavar='PX',
+                        help='Maze cell size in pixels (default 6%% of the shorter screen side, at least 40; '
+                             'must leave the player room between walls)')
+    parser.add_argument('--autopilot', action='store_true',
+                        help='Let a bot play: it steers with synthetic mouse motion and picks the round choices')
+    parser.add_argument('--profile-frames', type=int, metavar='N',
+                        help='Profile the first N frames: writes profile.pstats and profile_frames.csv')
+    parser.add_argument('--record', metavar='PATH',
+                        help='Record this session\'s input to PATH for replay')
+    parser.add_argument('--replay', metavar='PATH',
+                        help='Replay a recorded session headless and check it matches')
     args = parser.parse_args()
     
-    # Initialize Pygame
-    pygame.init()
+    # The frame loop divides by the frame rate (pygame would read 0 as uncapped)
+    if args.fps < 1:
+        parser.error("--fps must be at least 1")
+    
+    # SeedSequence takes only non-negative seeds
+    if args.seed is not None and args.seed < 0:
+        parser.error("--seed must be a non-negative integer")
     
     # Screen setup
     screen_width = 1024
     screen_height = 768
+    
+    # The autopilot only knows open space
+    if args.autopilot and args.maze:
+        parser.error("--autopilot can't steer through a maze; play --maze by hand")
+    
+    # Maze cells must leave the player room between the walls
+    if args.maze_cell is not None:
+        smallest = min_cell_size(maze_player_radius(screen_width, screen_height))
+        if args.maze_cell < smallest:
+            parser.error(f"--maze-cell must be at least {smallest} px at {screen_width}x{screen_height}")
+    
+    # Replays run headless, as fast as possible, and need no window
+    if args.replay:
+        result = replay(Recording.load(args.replay))
+        print(f"{result['ticks']} ticks in {result['seconds']:.2f}s: "
+              f"score {result['score']}, collisions {result['collisions']}")
+        if result['divergence'] is not None:
+            print(f"Replay diverged at tick {result['divergence']}")
+            sys.exit(1)
+        sys.exit()
+    
+    # Initialize Pygame
+    pygame.init()
+    
+    # Window
     screen = pygame.display.set_mode((screen_width, screen_height))
     pygame.display.set_caption("Drift")
     
     # Clock for FPS control
     clock = pygame.time.Clock()
-    fps = 60
+    fps = args.fps
+    
+    # Fixed physics timestep, decoupled from the display rate
+    tick_dt = 1.0 / args.tick_rate
+    max_frame_time = 0.25  # Don't try to catch up more than this after a hitch
+    accumulator = 0.0
     
     # Create game
-    game = Game(screen_width, screen_height, dev_mode=args.dev)
+    game = Game(screen_width, screen_height, dev_mode=args.dev, dirty_rects=args.dirty_rects, seed=args.seed,
+                maze=args.maze, maze_cell_size=args.maze_cell)
+    recorder = start_recording(game.sim) if args.record else None
+    autopilot = Autopilot(rate=fps, seed=args.seed) if args.autopilot else None
+    profiler = game.profiler
+    if args.profile_frames:
+        profiler.start_capture(args.profile_frames)
     
     # Game loop
     running = True
     start_time = pygame.time.get_ticks()
     
     while running:
+        # Real time since the last frame (also caps the display rate)
+        frame_time = min(clock.tick(fps) / 1000.0, max_frame_time)
+        profiler.lap('wait')
+        
+        # Autopilot input goes through the same event path as the mouse
+        if autopilot is not None:
+            if game.sim.game_state == 'playing':
+                game.handle_event(pygame.event.Event(pygame.MOUSEMOTION, rel=autopilot(game.sim),
+                                                     pos=pygame.mouse.get_pos(), buttons=(0, 0, 0)))
+            elif game.sim.game_state == 'transition':
+                button = game.ui.transition_button(*autopilot.choose(game.sim))
+                game.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=button.center))
+        
+        # Static screens: sleep until input (or the screen's own deadline)
+        # instead of redrawing an unchanged frame at full rate
+        events = []
+        wait_ms = game.static_screen_timeout()
+        if wait_ms is not None:
+            event = pygame.event.wait(wait_ms)
+            waited = clock.tick() / 1000.0
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+                # Idle time isn't simulated: the input may start a round,
+                # which mustn't then catch up on the time spent waiting
+                frame_time = 0.0
+            elif wait_ms:
+                # Ran out the title screen's own timer, which does count
+                frame_time = min(frame_time + waited, max_frame_time)
+            profiler.lap('wait')
+        events.extend(pygame.event.get())
+        
         # Event handling
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -42,22 +138,32 @@ def main():
                     running = False
             
             game.handle_event(event)
+        profiler.lap('events')
         
-        # Update
-        dt = 1.0 / fps  # Fixed timestep
-        game.update(dt)
+        # Update in fixed ticks until the simulation has caught up with real time
+        accumulator += frame_time
+        while accumulator >= tick_dt:
+            game.update(tick_dt)
+            accumulator -= tick_dt
+        game.end_frame()
+        profiler.lap('update')
         
-        # Draw
+        # Draw, interpolating between the last two ticks
         current_time = pygame.time.get_ticks() - start_time
-        game.draw(screen, current_time)
-        
-        # Flip display
-        pygame.display.flip()
+        dirty = game.draw(screen, current_time, accumulator / tick_dt)
+        profiler.lap('draw')
         
-        # Maintain FPS
-        clock.tick(fps)
+        # Present: the whole display, or just the regions that changed
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+        profiler.lap('present')
+        profiler.end_frame()
     
     # Cleanup
+    if recorder is not None:
+        recorder.recording.save(args.record)
     game.cleanup()
     pygame.quit()
     sys.exit()
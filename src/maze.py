@@ -0,0 +1,192 @@
+"""Maze mode: a carved grid of static walls with grid-based collision."""
+import math
+from collections import deque
+import pygame
+import numpy as np
+from collision import first_impact
+
+
+# Wall rocks have radius WALL_RADIUS * cell and hit at WALL_REACH of that
+WALL_RADIUS = 0.45
+WALL_REACH = 0.7
+
+
+def maze_player_radius(screen_width, screen_height):
+    """Player radius in maze mode: 3% of the shorter side, as in the web build."""
+    return max(12, int(min(screen_width, screen_height) * 0.03))
+
+
+def min_cell_size(player_radius):
+    """Smallest cell a player can sit in the middle of with room to steer.
+
+    From a cell centre the nearest walls are one cell away, so a cell must
+    exceed the wall reach (WALL_RADIUS * WALL_REACH * cell + player_radius)
+    plus a quarter of the player's radius of clearance.
+    """
+    return math.ceil(player_radius * 1.25 / (1 - WALL_RADIUS * WALL_REACH))
+
+
+class Maze:
+    """A perfect maze on a grid of square-ish cells covering the screen.
+
+    Walls are kept as a boolean grid (open[row, col]), so a collision test
+    only looks at the cells under the player's path and spawning walks the
+    grid breadth-first. Each wall cell is a small asteroid-like rock of
+    radius wall_radius at the cell centre, as in the web build.
+    """
+    
+    def __init__(self, screen_width, screen_height, rng, cell_size=None, player_radius=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        if player_radius is None:
+            player_radius = maze_player_radius(screen_width, screen_height)
+        self.player_radius = player_radius
+        
+        # Cells big enough for the player to navigate, stretched to fill the screen
+        if cell_size is None:
+            cell_size = max(40, int(min(screen_width, screen_height) * 0.06))
+        cell_size = max(cell_size, min_cell_size(player_radius))
+        self.cols = max(3, int(screen_width // cell_size))
+        self.rows = max(3, int(screen_height // cell_size))
+        self.cell_width = screen_width / self.cols
+        self.cell_height = screen_height / self.rows
+        self.wall_radius = min(self.cell_width, self.cell_height) * WALL_RADIUS
+        
+        self.open = self._carve(rng)
+        # Flat views for the breadth-first walks and spawn sampling
+        self.open_list = self.open.ravel().tolist()
+        self.open_cells = np.flatnonzero(self.open)
+    
+    def _carve(self, rng):
+        """Recursive backtracker over the odd cells; returns the open-cell grid."""
+        cells = np.zeros((self.rows, self.cols), dtype=bool)
+        cells[1, 1] = True
+        stack = [(1, 1)]
+        directions = [(0, 2), (0, -2), (2, 0), (-2, 0)]
+        while stack:
+            row, col = stack[-1]
+            rng.shuffle(directions)
+            for d_row, d_col in directions:
+                next_row, next_col = row + d_row, col + d_col
+                if (0 < next_row < self.rows - 1 and 0 < next_col < self.cols - 1
+                        and not cells[next_row, next_col]):
+                    # Carve through the wall between the two cells
+                    cells[row + d_row // 2, col + d_col // 2] = True
+                    cells[next_row, next_col] = True
+                    stack.append((next_row, next_col))
+                    break
+            else:
+                stack.pop()
+        return cells
+    
+    def cell_center(self, row, col):
+        """Screen position of the centre of a cell."""
+        return ((col + 0.5) * self.cell_width, (row + 0.5) * self.cell_height)
+    
+    def cell_at(self, x, y):
+        """(row, col) of the cell containing a screen position, clamped to the grid."""
+        col = min(self.cols - 1, max(0, int(x // self.cell_width)))
+        row = min(self.rows - 1, max(0, int(y // self.cell_height)))
+        return row, col
+    
+    def start_position(self):
+        """Centre of the first open cell (top-left), where the player starts."""
+        return self.cell_center(1, 1)
+    
+    def sweep_collision(self, segments, player_radius):
+        """Fraction of the step at which the player's swept path first
+        touches a wall, or None. Only walls near the path are tested."""
+        # Use slightly smaller collision radius for fairness
+        reach = self.wall_radius * WALL_REACH + player_radius
+        xs = [v for segment in segments for v in (segment[0], segment[2])]
+        ys = [v for segment in segments for v in (segment[1], segment[3])]
+        if not xs:
+            return None
+        
+        # Cells whose wall could reach the path's bounding box
+        col_0 = max(0, int((min(xs) - reach) // self.cell_width))
+        col_1 = min(self.cols, int((max(xs) + reach) // self.cell_width) + 1)
+        row_0 = max(0, int((min(ys) - reach) // self.cell_height))
+        row_1 = min(self.rows, int((max(ys) + reach) // self.cell_height) + 1)
+        if col_0 >= col_1 or row_0 >= row_1:
+            return None
+        rows, cols = np.nonzero(~self.open[row_0:row_1, col_0:col_1])
+        if len(rows) == 0:
+            return None
+        
+        wall_x = (cols + col_0 + 0.5) * self.cell_width
+        wall_y = (rows + row_0 + 0.5) * self.cell_height
+        return first_impact(segments, wall_x, wall_y, 0.0, 0.0, reach, 0.0)
+    
+    def distance_field(self, row, col, limit=None):
+        """Path distance in cells from (row, col) to every cell, by BFS.
+        
+        Returns a {flat cell index: distance} dict of the reached cells;
+        with limit, only cells at most limit steps away are walked.
+        """
+        cols = self.cols
+        is_open = self.open_list
+        start = row * cols + col
+        distance = {start: 0}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            step = distance[cell] + 1
+            if limit is not None and step > limit:
+                break
+            # The border is all wall, so open cells' neighbours never leave the grid
+            for neighbour in (cell - cols, cell + cols, cell - 1, cell + 1):
+                if is_open[neighbour] and neighbour not in distance:
+                    distance[neighbour] = step
+                    queue.append(neighbour)
+        return distance
+    
+    def spawn_point(self, rng, x, y, min_distance):
+        """Centre of a random open cell at least min_distance pixels along
+        the maze from (x, y), or of the farthest one if none is that far.
+        
+        Only the cells nearer than that are walked (a maze is all one
+        corridor system), then open cells are drawn until one is outside
+        them, so a pickup costs about the same however big the maze is.
+        """
+        row, col = self.cell_at(x, y)
+        if not self.open[row, col]:
+            # Grazing a wall cell's corner: measure from the start cell instead
+            row, col = 1, 1
+        min_steps = math.ceil(min_distance / min(self.cell_width, self.cell_height))
+        near = self.distance_field(row, col, min_steps - 1)
+        if len(near) < len(self.open_cells):
+            while True:
+                cell = int(self.open_cells[rng.randrange(len(self.open_cells))])
+                if cell not in near:
+                    break
+        else:
+            # The walk reached every cell, so the farthest is known
+            cell = max(near, key=near.get)
+        return self.cell_center(*divmod(cell, self.cols))
+    
+    def render_walls(self, surface, rng):
+        """Draw every wall as a rough rock onto surface (done once per maze)."""
+        rows, cols = np.nonzero(~self.open)
+        centre_x = (cols + 0.5) * self.cell_width
+        centre_y = (rows + 0.5) * self.cell_height
+        
+        # Rough shapes (vertices around a circle with random offsets 0.8 to 1.2),
+        # computed for all walls with the same vertex count at once
+        counts = np.array([rng.randint(6, 8) for _ in range(len(rows))])
+        rotation = np.array([rng.uniform(0, 2 * math.pi) for _ in range(len(rows))])
+        greys = [rng.randint(70, 99) for _ in range(len(rows))]
+        for count in range(6, 9):
+            walls = np.flatnonzero(counts == count)
+            if len(walls) == 0:
+                continue
+            offsets = np.array([[rng.uniform(0.8, 1.2) for _ in range(count)] for _ in walls])
+            angles = rotation[walls, None] + 2 * math.pi * np.arange(count) / count
+            radii = self.wall_radius * offsets
+            vertex_x = centre_x[walls, None] + radii * np.cos(angles)
+            vertex_y = centre_y[walls, None] + radii * np.sin(angles)
+            vertices = np.stack([vertex_x, vertex_y], axis=-1).tolist()
+            for wall, points in zip(walls.tolist(), vertices):
+                grey = greys[wall]
+                pygame.draw.polygon(surface, (grey, grey - 10, grey - 20), points)
+                pygame.draw.polygon(surface, (grey + 20, grey + 10, grey), points, 1)
@@ -5,12 +5,12 @@ import pygame
 class Player:
     """The white sphere controlled by swipes."""
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, radius=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        # Size: ~3% of screen width
-        self.radius = int(screen_width * 0.03)
+        # Size: ~3% of screen width unless given
+        self.radius = int(screen_width * 0.03) if radius is None else radius
         
         # Start in center
         self.x = screen_width / 2
@@ -20,6 +20,9 @@ class Player:
         self.vx = 0.0
         self.vy = 0.0
         
+        # Path travelled during the last update, for swept collision tests
+        self.motion_segments = []
+        
         self.color = (100, 150, 255)  # Blue
     
     def apply_impulse(self, dx, dy):
@@ -29,31 +32,55 @@ class Player:
     
     def update(self, dt):
         """Update position based on velocity."""
-        self.x += self.vx * dt
-        self.y += self.vy * dt
+        start_x, start_y = self.x, self.y
+        step_x = self.vx * dt
+        step_y = self.vy * dt
+        self.x += step_x
+        self.y += step_y
+        end_x, end_y = self.x, self.y
         
         # Screen wrapping
         if self.x - self.radius > self.screen_width:
             self.x = -self.radius
         elif self.x + self.radius < 0:
             self.x = self.screen_width + self.radius
-            
+        
         if self.y - self.radius > self.screen_height:
             self.y = -self.radius
         elif self.y + self.radius < 0:
             self.y = self.screen_height + self.radius
+        
+        # Motion segment for this step; a wrap adds the same motion ending
+        # at the wrapped position so both sides of the edge are swept
+        self.motion_segments = [(start_x, start_y, end_x, end_y)]
+        if self.x != end_x or self.y != end_y:
+            self.motion_segments.append((self.x - step_x, self.y - step_y, self.x, self.y))
     
-    def draw(self, screen):
-        """Draw the player sphere."""
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+    def render_position(self, alpha=1.0):
+        """Position blended between the last two ticks for rendering.
+        
+        alpha is how far the renderer is into the next tick (0 to 1). A step
+        that wrapped or reset the player is not blended.
+        """
+        if len(self.motion_segments) != 1:
+            return (self.x, self.y)
+        start_x, start_y = self.motion_segments[0][:2]
+        return (start_x + (self.x - start_x) * alpha, start_y + (self.y - start_y) * alpha)
+    
+    def draw(self, screen, position=None):
+        """Draw the player sphere. Returns the rect drawn."""
+        x, y = position if position is not None else (self.x, self.y)
+        return pygame.draw.circle(screen, self.color, (int(x), int(y)), self.radius)
     
     def get_position(self):
         """Return current position as tuple."""
         return (self.x, self.y)
     
-    def reset(self):
-        """Reset player to center with zero velocity."""
-        self.x = self.screen_width / 2
-        self.y = self.screen_height / 2
+    def reset(self, position=None):
+        """Reset player to center (or position) with zero velocity."""
+        if position is None:
+            position = (self.screen_width / 2, self.screen_height / 2)
+        self.x, self.y = position
         self.vx = 0.0
-        self.vy = 0.0
\ No newline at end of file
+        self.vy = 0.0
+        self.motion_segments = []
\ No newline at end of file
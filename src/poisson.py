@@ -0,0 +1,124 @@
+"""Poisson-disc placement of non-overlapping circles on a wrapping screen."""
+import math
+import numpy as np
+from spatial import wrapped_delta
+
+
+def poisson_disc_layout(radii, width, height, rng, keep_out=None, gap=0.0, darts=8, candidates=30):
+    """Positions (x, y arrays) for circles of the given radii that don't overlap.
+
+    Bridson's sampler generalized to per-circle radii: circles are placed
+    largest first, each at a random point in the annulus around an already
+    placed "active" circle, and an active circle that fails candidates
+    times in a row is retired. Before growing from the active list each
+    circle throws a few uniform darts, so sparse fields look as random as
+    plain uniform placement. Conflicts are looked up in a wrapping grid of
+    cells one largest diameter wide, so each test checks nine cells and the
+    layout costs O(n) tests.
+
+    keep_out is an optional (x, y, distance) circle that no circle may
+    reach into, and gap is extra space kept between circles. Distances
+    wrap at width and height like the screen. rng is a random.Random. If
+    the screen fills up, the remaining circles go at random points clear
+    of keep_out and may overlap.
+    """
+    # Plain lists: the tests below are scalar, where lists beat arrays
+    radii = [float(r) for r in radii]
+    n = len(radii)
+    xs = [0.0] * n
+    ys = [0.0] * n
+    if n == 0:
+        return np.zeros(0), np.zeros(0)
+    
+    # Grid of whole cells, each at least one largest separation wide
+    cell_size = max(1.0, 2.0 * max(radii) + gap)
+    cols = max(1, int(width // cell_size))
+    rows = max(1, int(height // cell_size))
+    cells = [[] for _ in range(rows * cols)]
+    # Neighbouring columns and rows (fewer than three on a tiny screen)
+    col_steps = sorted({-1 % cols, 0, 1 % cols})
+    row_steps = sorted({-1 % rows, 0, 1 % rows})
+    
+    half_width = width / 2
+    half_height = height / 2
+    
+    def cell_of(x, y):
+        return min(rows - 1, int(y * rows / height)) * cols + min(cols - 1, int(x * cols / width))
+    
+    def clear_of_keep_out(x, y, r):
+        if keep_out is None:
+            return True
+        dx = wrapped_delta(x - keep_out[0], width)
+        dy = wrapped_delta(y - keep_out[1], height)
+        reach = keep_out[2] + r
+        return dx * dx + dy * dy >= reach * reach
+    
+    def fits(x, y, r):
+        """Whether a circle of radius r at (x, y) is clear of keep_out and every placed circle."""
+        if not clear_of_keep_out(x, y, r):
+            return False
+        col = min(cols - 1, int(x * cols / width))
+        row = min(rows - 1, int(y * rows / height))
+        for row_step in row_steps:
+            base = (row + row_step) % rows * cols
+            for col_step in col_steps:
+                for j in cells[base + (col + col_step) % cols]:
+                    # wrapped_delta, inlined: this is the innermost loop
+                    dx = (xs[j] - x + half_width) % width - half_width
+                    dy = (ys[j] - y + half_height) % height - half_height
+                    reach = radii[j] + r + gap
+                    if dx * dx + dy * dy < reach * reach:
+                        return False
+        return True
+    
+    active = []
+    full = False
+    for i in sorted(range(n), key=lambda i: -radii[i]):
+        r = radii[i]
+        placed = False
+        
+        if not full:
+            # Uniform darts first
+            for _ in range(darts):
+                x = rng.uniform(0, width)
+                y = rng.uniform(0, height)
+                if fits(x, y, r):
+                    placed = True
+                    break
+            
+            # Then grow outward from the active circles
+            while not placed and active:
+                k = rng.randrange(len(active))
+                a = active[k]
+                separation = radii[a] + r + gap
+                for _ in range(candidates):
+                    distance = rng.uniform(separation, 2 * separation)
+                    angle = rng.uniform(0, 2 * math.pi)
+                    candidate_x = (xs[a] + distance * math.cos(angle)) % width
+                    candidate_y = (ys[a] + distance * math.sin(angle)) % height
+                    if fits(candidate_x, candidate_y, r):
+                        x, y = candidate_x, candidate_y
+                        placed = True
+                        break
+                else:
+                    # Nothing fits around this circle any more
+                    active[k] = active[-1]
+                    active.pop()
+            # No room left for this size, so none for the (smaller) rest either
+            full = not placed
+        
+        if not placed:
+            # Overlap other circles, but still keep out of keep_out if possible
+            for _ in range(darts):
+                x = rng.uniform(0, width)
+                y = rng.uniform(0, height)
+                if clear_of_keep_out(x, y, r):
+                    break
+        
+        xs[i] = x
+        ys[i] = y
+        cells[cell_of(x, y)].append(i)
+        if placed:
+            active.append(i)
+    
+    return np.array(xs), np.array(ys)
@@ -0,0 +1,135 @@
+"""Per-phase frame timing with rolling percentiles, an overlay and cProfile capture."""
+import csv
+import time
+import cProfile
+import pygame
+import numpy as np
+
+
+class FrameProfiler:
+    """Times each phase of a frame with lap marks.
+
+    lap(name) charges the time since the previous lap to phase name (laps
+    with the same name add up within a frame), and end_frame() closes the
+    frame. That is one perf_counter call and a dict update per phase, cheap
+    enough to leave on. Percentiles are computed over the last window
+    frames only when the overlay asks for them.
+    """
+    
+    def __init__(self, window=300, refresh_frames=30):
+        self.window = window
+        self.frames = 0
+        self.phases = {}  # name -> seconds per frame over the window
+        self.current = {}
+        self.last = time.perf_counter()
+        self.frame_start = self.last
+        
+        # On-screen overlay, re-rendered every refresh_frames frames
+        self.visible = False
+        self.refresh_frames = refresh_frames
+        self.overlay = None
+        self.font = None
+        
+        # cProfile and per-frame CSV capture
+        self.capture = None
+    
+    def lap(self, name):
+        """Charge the time since the last lap to phase name."""
+        now = time.perf_counter()
+        self.current[name] = self.current.get(name, 0.0) + (now - self.last)
+        self.last = now
+    
+    def end_frame(self):
+        """Close the frame: record every phase's time and the frame total."""
+        self.lap('other')
+        self.current['frame'] = self.last - self.frame_start
+        self.frame_start = self.last
+        
+        slot = self.frames % self.window
+        for name in self.current:
+            if name not in self.phases:
+                self.phases[name] = np.zeros(self.window)
+        for name, samples in self.phases.items():
+            samples[slot] = self.current.get(name, 0.0)
+        self.frames += 1
+        
+        if self.capture is not None:
+            self._capture_frame()
+        self.current = {}
+    
+    def percentiles(self):
+        """{phase: (p50, p95, p99)} in milliseconds over the recent window."""
+        count = min(self.frames, self.window)
+        if count == 0:
+            return {}
+        return {name: tuple(np.percentile(samples[:count], (50, 95, 99)) * 1000)
+                for name, samples in self.phases.items()}
+    
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self.overlay = None
+    
+    def draw(self, screen):
+        """Draw the overlay in the bottom-left corner if visible. Returns its rect or None."""
+        if not self.visible:
+            return None
+        if self.overlay is None or self.frames % self.refresh_frames == 0:
+            self.overlay = self._render_overlay()
+        return screen.blit(self.overlay, (10, screen.get_height() - self.overlay.get_height() - 10))
+    
+    def _render_overlay(self):
+        """Render the percentile table onto a translucent panel."""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+        stats = self.percentiles()
+        rows = [("phase (ms)", "p50", "p95", "p99")]
+        for name in sorted(stats, key=lambda name: -stats[name][0]):
+            rows.append((name,) + tuple(f"{value:.2f}" for value in stats[name]))
+        
+        # Name column left-aligned, numbers right-aligned in fixed columns
+        color = (200, 255, 200)
+        cells = [[self.font.render(text, True, color) for text in row] for row in rows]
+        name_width = max(row[0].get_width() for row in cells) + 12
+        column_width = 48
+        line_height = self.font.get_linesize()
+        panel = pygame.Surface((name_width + column_width * 3 + 16, line_height * len(rows) + 12),
+                               pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, row in enumerate(cells):
+            y = 6 + i * line_height
+            panel.blit(row[0], (8, y))
+            for j, cell in enumerate(row[1:]):
+                panel.blit(cell, (8 + name_width + column_width * (j + 1) - cell.get_width(), y))
+        return panel
+    
+    def start_capture(self, frames, prefix='profile'):
+        """Run cProfile and log every phase for the next frames frames.
+
+        Writes prefix.pstats and prefix_frames.csv when done.
+        """
+        profile = cProfile.Profile()
+        self.capture = {'remaining': frames, 'prefix': prefix, 'rows': [], 'profile': profile}
+        profile.enable()
+    
+    def _capture_frame(self):
+        """Log the closed frame; write the capture files after the last one."""
+        capture = self.capture
+        capture['rows'].append(dict(self.current))
+        capture['remaining'] -= 1
+        if capture['remaining'] > 0:
+            return
+        
+        capture['profile'].disable()
+        capture['profile'].dump_stats(capture['prefix'] + '.pstats')
+        
+        names = sorted({name for row in capture['rows'] for name in row if name != 'frame'})
+        with open(capture['prefix'] + '_frames.csv', 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'frame_ms'] + [name + '_ms' for name in names])
+            for i, row in enumerate(capture['rows']):
+                writer.writerow([i, f"{row['frame'] * 1000:.3f}"] +
+                                [f"{row.get(name, 0.0) * 1000:.3f}" for name in names])
+        print(f"Profiled {len(capture['rows'])} frames: "
+              f"{capture['prefix']}.pstats, {capture['prefix']}_frames.csv")
+        self.capture = None
@@ -0,0 +1,151 @@
+"""Input recording and deterministic headless replay of a Simulation."""
+import json
+import hashlib
+import time
+import struct
+from simulation import Simulation
+
+
+def state_hash(sim):
+    """Short hash of everything a tick can change: player, asteroids, target, score."""
+    digest = hashlib.blake2b(digest_size=8)
+    player = sim.player
+    digest.update(struct.pack('<4d', player.x, player.y, player.vx, player.vy))
+    field = sim.asteroid_field
+    for array in (field.x, field.y, field.vx, field.vy, field.radius, field.rotation_speed):
+        digest.update(array.tobytes())
+    digest.update(struct.pack('<2d', sim.collectible.x, sim.collectible.y))
+    digest.update(struct.pack('<4i', sim.score, sim.level, sim.collisions, sim.ticks))
+    digest.update(sim.game_state.encode())
+    return digest.hexdigest()
+
+
+class Recording:
+    """A session's inputs, in the order they reached the Simulation, plus its seed.
+
+    Commands are lists: ['motion', dx, dy, events], ['param', name, value],
+    ['choose', name, delta], ['skip_title'], ['step', dt, release_input]
+    and ['release'].
+    hashes holds state_hash after every step.
+    """
+    
+    def __init__(self, seed, screen_width, screen_height, round_duration, title_duration,
+                 maze=False, maze_cell_size=None):
+        self.seed = seed
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.round_duration = round_duration
+        self.title_duration = title_duration
+        self.maze = maze
+        self.maze_cell_size = maze_cell_size
+        self.commands = []
+        self.hashes = []
+    
+    def save(self, path):
+        """Write the recording as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.__dict__, f)
+    
+    @classmethod
+    def load(cls, path):
+        """Read a recording written by save()."""
+        with open(path) as f:
+            data = json.load(f)
+        recording = cls(data['seed'], data['screen_width'], data['screen_height'],
+                        data['round_duration'], data['title_duration'],
+                        data.get('maze', False), data.get('maze_cell_size'))
+        recording.commands = data['commands']
+        recording.hashes = data['hashes']
+        return recording
+
+
+class Recorder:
+    """Attached to a Simulation as sim.recorder; logs each input as it arrives."""
+    
+    def __init__(self, sim):
+        self.sim = sim
+        self.recording = Recording(sim.seed, sim.screen_width, sim.screen_height,
+                                   sim.round_duration, sim.title_duration,
+                                   sim.maze is not None, sim.maze_cell_size)
+        self.parameters = sim.swipe_processor.get_parameters()
+    
+    def _sync_parameters(self):
+        """Log parameter changes made directly on the swipe processor (held keys)."""
+        params = self.sim.swipe_processor.get_parameters()
+        for name, value in params.items():
+            if self.parameters.get(name) != value:
+                self.recording.commands.append(['param', name, value])
+        self.parameters = params
+    
+    def motion(self, rel_x, rel_y, events):
+        self._sync_parameters()
+        self.recording.commands.append(['motion', rel_x, rel_y, events])
+    
+    def choose(self, param_name, delta):
+        self._sync_parameters()
+        self.recording.commands.append(['choose', param_name, delta])
+    
+    def skip_title(self):
+        self._sync_parameters()
+        self.recording.commands.append(['skip_title'])
+    
+    def step(self, dt, release_input):
+        self._sync_parameters()
+        self.recording.commands.append(['step', dt, release_input])
+    
+    def stepped(self):
+        self.recording.hashes.append(state_hash(self.sim))
+    
+    def release(self):
+        self._sync_parameters()
+        self.recording.commands.append(['release'])
+
+
+def start_recording(sim):
+    """Attach a Recorder to sim and return it."""
+    sim.recorder = Recorder(sim)
+    return sim.recorder
+
+
+def replay(recording):
+    """Re-run a recording headless as fast as possible and check every tick.
+
+    Returns a dict with the final score, collisions and tick count, the
+    wall-clock seconds taken, and the first tick whose state hash differs
+    from the recording (None if the replay matched throughout).
+    """
+    sim = Simulation(recording.screen_width, recording.screen_height,
+                     round_duration=recording.round_duration,
+                     title_duration=recording.title_duration,
+                     seed=recording.seed, maze=recording.maze,
+                     maze_cell_size=recording.maze_cell_size)
+    
+    divergence = None
+    tick = 0
+    start = time.perf_counter()
+    for command in recording.commands:
+        kind = command[0]
+        if kind == 'motion':
+            sim.add_motion(*command[1:])
+        elif kind == 'param':
+            sim.swipe_processor.set_parameter(command[1], command[2])
+        elif kind == 'choose':
+            sim.choose_adjustment(command[1], command[2])
+        elif kind == 'skip_title':
+            sim.skip_title()
+        elif kind == 'step':
+            sim.step(command[1], release_input=command[2])
+            if divergence is None and tick < len(recording.hashes) and state_hash(sim) != recording.hashes[tick]:
+                divergence = tick
+            tick += 1
+        elif kind == 'release':
+            sim.release_input()
+    elapsed = time.perf_counter() - start
+    
+    return {
+        'ticks': tick,
+        'score': sim.score,
+        'collisions': sim.collisions,
+        'seconds': elapsed,
+        'divergence': divergence,
+    }
@@ -0,0 +1,298 @@
+"""Headless simulation core: physics, scoring and round state without a display."""
+from player import Player
+from collectible import Collectible
+from swipe import SwipeProcessor
+from asteroid import AsteroidField
+from input import MotionWindow
+from maze import Maze, maze_player_radius
+from rng import RandomStreams
+
+
+# Thrust is tuned as a per-tick impulse at this rate; other tick rates scale it by dt
+THRUST_REFERENCE_RATE = 60.0
+
+
+class Simulation:
+    """Game rules stepped with an explicit dt and a synthetic input vector.
+
+    Holds the player, collectible, asteroid field, score, round timer and
+    round state. Nothing here touches the window, the mouse or the pygame
+    clock, so rounds can be run headless as fast as the CPU allows.
+    """
+    
+    def __init__(self, screen_width, screen_height, round_duration=60.0, title_duration=1.0, seed=None,
+                 maze=False, maze_cell_size=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.round_duration = round_duration
+        self.title_duration = title_duration
+        
+        # World seed; each subsystem draws from its own stream of it
+        self.streams = RandomStreams(seed)
+        self.seed = self.streams.seed
+        
+        # Game objects
+        # Maze corridors are sized from the shorter side, so the player is too
+        self.player = Player(screen_width, screen_height,
+                             maze_player_radius(screen_width, screen_height) if maze else None)
+        self.collectible = Collectible(screen_width, screen_height, self.player.radius, self.streams)
+        self.swipe_processor = SwipeProcessor()
+        # Asteroids start clear of the player, as after a respawn
+        self.asteroid_field = AsteroidField(screen_width, screen_height, count=0 if maze else 3,
+                                            streams=self.streams, keep_out=(*self.player.get_position(), 150))
+        
+        # Maze mode: static walls instead of asteroids, a new maze each round
+        self.maze_cell_size = maze_cell_size
+        self.maze_rng = self.streams.python('maze') if maze else None
+        self.maze = self._new_maze() if maze else None
+        self._reset_player()
+        
+        # Score
+        self.score = 0
+        self.level = 0
+        self.targets_per_level = 5
+        self.level_targets_collected = 0
+        self.collisions = 0
+        
+        # Timer (one round)
+        self.time_remaining = self.round_duration
+        
+        # Game state: 'title', 'playing', 'transition'
+        self.game_state = 'title'
+        self.title_elapsed = 0.0
+        
+        # Continuous thrust state
+        self.is_thrusting = False
+        self.current_thrust = (0, 0)  # Current tick's thrust vector
+        self.thrust_history = MotionWindow(100)  # Recent thrust directions for smoothing
+        
+        # Events raised by the last step: 'round_start', 'round_over', 'collect', 'hit'
+        self.events = []
+        self.ticks = 0
+        
+        # Input recorder (see replay.py), None when not recording
+        self.recorder = None
+        
+        # Frame profiler (see profiler.py), None when headless
+        self.profiler = None
+        
+        # Spawn first collectible (avoiding asteroids)
+        self._spawn_collectible()
+    
+    def add_motion(self, rel_x, rel_y, events=1):
+        """Feed mouse motion into the continuous thrust.
+        
+        (rel_x, rel_y) is one motion event's delta; a frame's coalesced
+        motion passes the mean delta of its events and how many there were,
+        so smoothing still averages over the same number of events.
+        """
+        # Only thrust if there's actual movement
+        if rel_x == 0 and rel_y == 0:
+            return
+        
+        if self.recorder is not None:
+            self.recorder.motion(rel_x, rel_y, events)
+        
+        self.is_thrusting = True
+        
+        # Add to history, one sample per event
+        self.thrust_history.push(rel_x, rel_y, events)
+        
+        # Smoothness 1-10 maps to averaging over the last 10-100 samples
+        params = self.swipe_processor.get_parameters()
+        avg_dx, avg_dy = self.thrust_history.mean(params['smoothness'] * 10)
+        
+        # Apply strength multiplier (0.1x to 1.0x)
+        multiplier = 0.1 + (params['strength'] / 10) * 0.9
+        
+        # Scale down for continuous application
+        continuous_scale = 0.5
+        
+        self.current_thrust = (avg_dx * multiplier * continuous_scale,
+                               avg_dy * multiplier * continuous_scale)
+    
+    def choose_adjustment(self, param_name, delta):
+        """Apply a transition-screen parameter choice and start the next round."""
+        if self.game_state != 'transition':
+            return
+        if self.recorder is not None:
+            self.recorder.choose(param_name, delta)
+        params = self.swipe_processor.get_parameters()
+        self.swipe_processor.set_parameter(param_name, params[param_name] + delta)
+        self.level_targets_collected = 0
+        self._start_round()
+    
+    def skip_title(self):
+        """Jump straight from the title screen into round 1."""
+        if self.game_state != 'title':
+            return
+        if self.recorder is not None:
+            self.recorder.skip_title()
+        self._skip_title()
+    
+    def _skip_title(self):
+        """skip_title() without the recorder hook (the title timer runs out in a tick)."""
+        self.level = 1
+        self._start_round()
+    
+    def _start_round(self):
+        """Reset the timer and player velocity and begin playing."""
+        self.game_state = 'playing'
+        self.time_remaining = self.round_duration
+        self.player.vx = 0
+        self.player.vy = 0
+        if self.maze is not None:
+            self.maze = self._new_maze()
+            self._reset_player()
+            self._spawn_collectible()
+        self.events.append('round_start')
+    
+    def _new_maze(self):
+        """A freshly carved maze sized for the player."""
+        return Maze(self.screen_width, self.screen_height, self.maze_rng, self.maze_cell_size,
+                    self.player.radius)
+    
+    def _reset_player(self):
+        """Put the player back at the start: the screen centre, or the maze's first open cell."""
+        self.player.reset(self.maze.start_position() if self.maze is not None else None)
+    
+    def _spawn_collectible(self):
+        """Spawn the target away from the player, clear of asteroids or in an open maze cell."""
+        player_x, player_y = self.player.get_position()
+        if self.maze is not None:
+            return self.collectible.spawn_in_maze(self.maze, player_x, player_y)
+        return self.collectible.spawn(player_x, player_y, self.asteroid_field)
+    
+    def step(self, dt, motion=None, release_input=True):
+        """Advance the simulation by dt seconds. Returns the events raised.
+        
+        Each input frame's thrust is held until release_input() is called;
+        by default that happens at the end of every step, so one step is one
+        input frame. A fixed-timestep loop passes release_input=False and
+        releases once per rendered frame instead.
+        """
+        if motion is not None:
+            self.add_motion(motion[0], motion[1])
+        if self.recorder is not None:
+            self.recorder.step(dt, release_input)
+        events = self._advance(dt, release_input)
+        if self.recorder is not None:
+            self.recorder.stepped()
+        return events
+    
+    def _advance(self, dt, release_input):
+        """One tick of the rules; step() without the input and recorder hooks."""
+        self.events = []
+        self.ticks += 1
+        
+        # Title screen - auto-advance after title_duration
+        if self.game_state == 'title':
+            self.title_elapsed += dt
+            if self.title_elapsed > self.title_duration:
+                self._skip_title()
+            return self.events
+        
+        # Nothing moves while the transition screen waits for a choice
+        if self.game_state == 'transition':
+            return self.events
+        
+        # Update timer
+        self.time_remaining -= dt
+        if self.time_remaining <= 0:
+            self.time_remaining = 0
+            # Round over - go to transition screen
+            self.game_state = 'transition'
+            self.level += 1
+            # Drop the thrust so it doesn't carry into the next round
+            self.is_thrusting = False
+            self.current_thrust = (0, 0)
+            self.thrust_history.clear()
+            self.events.append('round_over')
+            return self.events
+        
+        # Apply continuous thrust (scaled so the tick rate doesn't change it)
+        if self.is_thrusting and (self.current_thrust[0] != 0 or self.current_thrust[1] != 0):
+            scale = dt * THRUST_REFERENCE_RATE
+            self.player.apply_impulse(self.current_thrust[0] * scale, self.current_thrust[1] * scale)
+        
+        # Update player
+        self.player.update(dt)
+        
+        # Update asteroids
+        if self.profiler is not None:
+            self.profiler.lap('update')
+        self.asteroid_field.update(dt)
+        if self.profiler is not None:
+            self.profiler.lap('update.asteroids')
+        
+        # Update collectible animation (and retry a spawn that found no room)
+        self.collectible.update(dt)
+        if not self.collectible.active:
+            self._spawn_collectible()
+        
+        # Swept collision tests along this step's path, so fast motion or a
+        # coarse tick cannot tunnel through a target, an asteroid or a wall
+        segments = self.player.motion_segments
+        radius = self.player.radius
+        collect_time = self.collectible.sweep_collision(segments, radius)
+        if self.maze is not None:
+            hit_time = self.maze.sweep_collision(segments, radius)
+        else:
+            hit_time = self.asteroid_field.sweep_collision(segments, radius, dt)
+        
+        # Check collision with collectible (only if reached before any asteroid)
+        if collect_time is not None and (hit_time is None or collect_time <= hit_time):
+            # Collected!
+            self.score += 1
+            self.level_targets_collected += 1
+            self.events.append('collect')
+            self._spawn_collectible()
+        
+        # Check collision with asteroids or walls
+        if hit_time is not None:
+            # Hit - reset player and lose points
+            self._reset_player()
+            self.score = max(0, self.score - 1)
+            self.collisions += 1
+            self.events.append('hit')
+            # Respawn asteroids away from player (maze walls stay put)
+            if self.maze is None:
+                new_x, new_y = self.player.get_position()
+                self.asteroid_field.respawn_away_from(new_x, new_y, 150)
+        
+        if self.profiler is not None:
+            self.profiler.lap('update.collisions')
+        
+        if release_input:
+            self._release()
+        
+        return self.events
+    
+    def release_input(self):
+        """End the current input frame; thrust stops until the next motion."""
+        if self.recorder is not None:
+            self.recorder.release()
+        self._release()
+    
+    def _release(self):
+        """release_input() without the recorder hook."""
+        if self.game_state != 'playing':
+            return
+        # Clear thrust so flame disappears when not actively thrusting
+        if not self.is_thrusting:
+            self.current_thrust = (0, 0)
+            self.thrust_history.clear()
+        self.is_thrusting = False
+    
+    def run_round(self, dt=1.0 / 60, policy=None):
+        """Play one full round headless and return its score.
+
+        policy is called as policy(sim) each tick and returns a mouse delta
+        (dx, dy) or None for no input.
+        """
+        self.skip_title()
+        start_score = self.score
+        while self.game_state == 'playing':
+            motion = policy(self) if policy is not None else None
+            self.step(dt, motion)
+        return self.score - start_score
@@ -0,0 +1,208 @@
+"""Wrap-aware uniform-grid broad phase for circle collisions."""
+import numpy as np
+
+
+# Below this many circles every pair is a candidate
+SMALL_SET = 16
+
+
+def wrapped_delta(delta, extent):
+    """Shortest displacement along one axis of a screen that wraps at extent."""
+    return (delta + extent / 2) % extent - extent / 2
+
+
+def candidate_pairs(x, y, radius, width, height):
+    """Return index arrays (i, j), i < j, of circles that may overlap.
+    
+    Circles are binned into a uniform grid whose cells are at least one
+    diameter of the largest circle wide, so any overlapping pair sits in
+    the same or adjacent cells. The grid wraps like the screen does, so
+    circles on opposite edges are paired too. Pairs come back sorted by
+    (i, j).
+    """
+    n = len(x)
+    empty = np.zeros(0, dtype=np.intp)
+    if n < 2:
+        return empty, empty
+    if n <= SMALL_SET:
+        # Binning costs more than testing every pair of a handful of circles
+        return np.triu_indices(n, k=1)
+    
+    # Grid dimensions: whole number of cells per axis, each >= one max diameter
+    cell_size = max(1.0, 2.0 * float(np.max(radius)))
+    cols = max(1, int(width // cell_size))
+    rows = max(1, int(height // cell_size))
+    
+    cx = np.minimum((np.mod(x, width) * (cols / width)).astype(np.intp), cols - 1)
+    cy = np.minimum((np.mod(y, height) * (rows / height)).astype(np.intp), rows - 1)
+    keys = cy * cols + cx
+    
+    # Sort circles by cell so each cell's members are one contiguous run
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    
+    # Distinct neighbour offsets (small grids wrap several offsets onto one cell)
+    offsets_x = sorted({o % cols for o in (-1, 0, 1)})
+    offsets_y = sorted({o % rows for o in (-1, 0, 1)})
+    
+    owners = np.arange(n)
+    pairs_i = []
+    pairs_j = []
+    for oy in offsets_y:
+        for ox in offsets_x:
+            neighbour = ((cy + oy) % rows) * cols + (cx + ox) % cols
+            starts = np.searchsorted(sorted_keys, neighbour, side='left')
+            counts = np.searchsorted(sorted_keys, neighbour, side='right') - starts
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            # Expand each circle's run of neighbours into explicit pairs
+            first = np.repeat(np.cumsum(counts) - counts, counts)
+            within = np.arange(total) - first
+            i = np.repeat(owners, counts)
+            j = order[np.repeat(starts, counts) + within]
+            keep = i < j
+            pairs_i.append(i[keep])
+            pairs_j.append(j[keep])
+    
+    if not pairs_i:
+        return empty, empty
+    pairs_i = np.concatenate(pairs_i)
+    pairs_j = np.concatenate(pairs_j)
+    ordering = np.lexsort((pairs_j, pairs_i))
+    return pairs_i[ordering], pairs_j[ordering]
+
+
+class OccupancyGrid:
+    """Free-space grid over a rectangle, with circular obstacles stamped in.
+    
+    Each cell counts the obstacles that could reach any point inside it
+    (discs are widened by a cell diagonal, so a point anywhere in a free
+    cell is clear). Only obstacles that moved to another cell are
+    re-stamped (in one vectorized pass when many have), and sampling picks
+    random cells until one is free, so placement costs O(1) expected
+    however many obstacles there are.
+    """
+    
+    # Up to this many discs are stamped one slice at a time
+    SLICE_STAMPS = 16
+    
+    def __init__(self, left, top, width, height, cell_size=8):
+        self.left = left
+        self.top = top
+        self.cell_size = cell_size
+        # Whole cells only, so every sampled point lies inside the rectangle
+        self.cols = max(1, int(width // cell_size))
+        self.rows = max(1, int(height // cell_size))
+        self.blocked = np.zeros((self.rows, self.cols), dtype=np.int32)
+        
+        # Where the obstacles are stamped: (rows, cols, reaches) arrays
+        self.stamps = None
+        self.masks = {}
+    
+    def _mask(self, reach):
+        """Boolean disc of the cells an obstacle can reach, centred on its cell."""
+        mask = self.masks.get(reach)
+        if mask is None:
+            # Cell-centre distance bound: reach plus both centres' offsets
+            span = reach + self.cell_size * np.sqrt(2)
+            half = int(np.ceil(span / self.cell_size))
+            offsets = np.arange(-half, half + 1) * self.cell_size
+            mask = offsets[:, None] ** 2 + offsets[None, :] ** 2 < span * span
+            self.masks[reach] = mask
+        return mask
+    
+    def _stamp(self, rows, cols, reaches, sign):
+        """Add sign to the count of every cell within reach of each cell (row, col)."""
+        if len(rows) <= self.SLICE_STAMPS:
+            for row, col, reach in zip(rows.tolist(), cols.tolist(), reaches.tolist()):
+                self._stamp_one(row, col, reach, sign)
+            return
+        
+        # Many discs: list every covered cell and add one histogram of them
+        cells = []
+        for reach in np.unique(reaches).tolist():
+            group = reaches == reach
+            mask = self._mask(reach)
+            half = mask.shape[0] // 2
+            offset_rows, offset_cols = np.nonzero(mask)
+            cell_rows = (rows[group, None] + (offset_rows - half)).ravel()
+            cell_cols = (cols[group, None] + (offset_cols - half)).ravel()
+            # Clip the discs to the grid
+            inside = (cell_rows >= 0) & (cell_rows < self.rows) & (cell_cols >= 0) & (cell_cols < self.cols)
+            cells.append(cell_rows[inside] * self.cols + cell_cols[inside])
+        counts = np.bincount(np.concatenate(cells), minlength=self.blocked.size)
+        self.blocked += sign * counts.reshape(self.blocked.shape).astype(np.int32)
+    
+    def _stamp_one(self, row, col, reach, sign):
+        """_stamp for a single disc, as one slice update."""
+        mask = self._mask(reach)
+        half = mask.shape[0] // 2
+        top = row - half
+        left = col - half
+        # Clip the disc to the grid
+        r0, c0 = max(0, top), max(0, left)
+        r1 = min(self.rows, top + mask.shape[0])
+        c1 = min(self.cols, left + mask.shape[1])
+        if r0 < r1 and c0 < c1:
+            self.blocked[r0:r1, c0:c1] += sign * mask[r0 - top:r1 - top, c0 - left:c1 - left]
+    
+    def update(self, x, y, reach):
+        """Bring the stamps up to date with obstacle arrays; only moved ones are redone.
+        
+        reach is each obstacle's keep-out distance (rounded up to whole pixels).
+        """
+        stamps = (np.floor((np.asarray(y) - self.top) / self.cell_size).astype(np.int64),
+                  np.floor((np.asarray(x) - self.left) / self.cell_size).astype(np.int64),
+                  np.ceil(reach).astype(np.int64))
+        if self.stamps is None or len(self.stamps[0]) != len(stamps[0]):
+            self.clear()
+            self._stamp(*stamps, 1)
+        else:
+            moved = (stamps[0] != self.stamps[0]) | (stamps[1] != self.stamps[1]) | (stamps[2] != self.stamps[2])
+            if moved.any():
+                self._stamp(*(old[moved] for old in self.stamps), -1)
+                self._stamp(*(new[moved] for new in stamps), 1)
+        self.stamps = stamps
+    
+    def clear(self):
+        """Remove all obstacles."""
+        self.blocked[:] = 0
+        self.stamps = None
+    
+    def cell_center(self, row, col):
+        """Pixel centre of a cell."""
+        return (self.left + (col + 0.5) * self.cell_size, self.top + (row + 0.5) * self.cell_size)
+    
+    def sample(self, rng, keep_out=None, tries=32):
+        """Random point in a free cell, or None if there is none.
+        
+        rng is a random.Random. keep_out is an optional (x, y, distance)
+        circle the point must stay outside. Random cells are tried first;
+        after tries misses the free cells are listed exactly, so the answer
+        is only None when no valid point exists.
+        """
+        size = self.cell_size
+        for _ in range(tries):
+            row = rng.randrange(self.rows)
+            col = rng.randrange(self.cols)
+            if self.blocked[row, col]:
+                continue
+            x = self.left + (col + rng.random()) * size
+            y = self.top + (row + rng.random()) * size
+            if keep_out is None or (x - keep_out[0]) ** 2 + (y - keep_out[1]) ** 2 >= keep_out[2] ** 2:
+                return (x, y)
+        
+        # Crowded: list the free cells wholly outside the keep-out circle
+        free = self.blocked == 0
+        if keep_out is not None:
+            centers_y = self.top + (np.arange(self.rows) + 0.5) * size
+            centers_x = self.left + (np.arange(self.cols) + 0.5) * size
+            clearance = keep_out[2] + size * np.sqrt(2) / 2
+            free &= ((centers_y[:, None] - keep_out[1]) ** 2 +
+                     (centers_x[None, :] - keep_out[0]) ** 2) >= clearance * clearance
+        cells = np.flatnonzero(free)
+        if len(cells) == 0:
+            return None
+        row, col = divmod(int(cells[rng.randrange(len(cells))]), self.cols)
+        return (self.left + (col + rng.random()) * size, self.top + (row + rng.random()) * size)
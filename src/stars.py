@@ -1,49 +1,112 @@
 """Procedurally generated starfield background with twinkling animation."""
-import random
 import math
 import pygame
+import numpy as np
+from rng import RandomStreams
 
 
-class Star:
-    """A single twinkling star."""
-    
-    def __init__(self, x, y, size, period):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.period = period  # milliseconds for one complete twinkle cycle
-        self.phase = random.uniform(0, 2 * 3.14159)  # random starting phase
+def _disc_offsets(radius):
+    """Pixel offsets covered by pygame.draw.circle at this radius."""
+    size = radius * 2 + 3
+    stamp = pygame.Surface((size, size))
+    pygame.draw.circle(stamp, (255, 255, 255), (size // 2, size // 2), radius)
+    mask = pygame.surfarray.array_red(stamp) > 0
+    dx, dy = np.nonzero(mask)
+    return dx - size // 2, dy - size // 2
+
+
+class StarLayer:
+    """One parallax depth of twinkling stars, held as arrays."""
+    
+    def __init__(self, screen_width, screen_height, count, parallax, brightness, max_size, rng):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.parallax = parallax  # Fraction of the camera offset this layer moves by
+        self.brightness = brightness  # Peak brightness (0-1)
+        
+        self.x = rng.integers(0, screen_width, count)
+        self.y = rng.integers(0, screen_height, count)
+        self.size = rng.integers(1, max_size + 1, count)
+        self.period = rng.uniform(2000, 6000, count)  # ms per twinkle
+        self.phase = rng.uniform(0, 2 * math.pi, count)
         
-    def get_opacity(self, time_ms):
-        """Calculate opacity based on time (20% to 100%)."""
-        # Sine wave oscillation
-        cycle = (time_ms / self.period + self.phase) % (2 * math.pi)
-        # Map sine wave (-1 to 1) to opacity range (0.2 to 1.0)
-        opacity = 0.6 + 0.4 * math.sin(cycle)
-        return max(0.2, min(1.0, opacity))
+        # Big stars are drawn as discs, so keep them in their own index set
+        self.large = np.flatnonzero(self.size > 1)
+    
+    def get_values(self, time_ms):
+        """Grey level (0-255) of every star at this time, 20% to 100% of peak."""
+        opacity = np.clip(0.6 + 0.4 * np.sin(time_ms / self.period + self.phase), 0.2, 1.0)
+        return (255 * self.brightness * opacity).astype(np.uint8)
+    
+    def get_positions(self, offset):
+        """Integer screen positions after parallax shift, wrapped to the screen."""
+        shift_x = int(-offset[0] * self.parallax)
+        shift_y = int(-offset[1] * self.parallax)
+        return (self.x + shift_x) % self.screen_width, (self.y + shift_y) % self.screen_height
 
 
 class Starfield:
-    """Manages the background starfield."""
+    """Manages the background starfield.
+    
+    Stars are split across parallax depth layers (far layers are dimmer,
+    smaller and move less with the camera offset). Twinkle brightness for
+    every star is computed in one vectorized step and written straight
+    into the screen's pixels.
+    """
     
-    def __init__(self, screen_width, screen_height, star_count=100):
-        self.stars = []
+    # (share of stars, parallax, peak brightness, max size)
+    LAYERS = (
+        (0.6, 0.0, 0.8, 1),
+        (0.3, 0.02, 1.0, 2),
+        (0.1, 0.05, 1.0, 2),
+    )
+    
+    def __init__(self, screen_width, screen_height, star_count=100, layers=LAYERS, streams=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.layers = []
+        rng = (streams or RandomStreams()).numpy('stars')
+        
+        remaining = star_count
+        for i, (share, parallax, brightness, max_size) in enumerate(layers):
+            count = remaining if i == len(layers) - 1 else int(star_count * share)
+            remaining -= count
+            self.layers.append(StarLayer(screen_width, screen_height, count,
+                                         parallax, brightness, max_size, rng))
+        
+        self.disc_dx, self.disc_dy = _disc_offsets(2)
+    
+    def draw(self, screen, time_ms, offset=(0, 0)):
+        """Draw all stars with current opacity, shifted by the camera offset."""
+        if screen.get_bitsize() != 32:
+            self._draw_slow(screen, time_ms, offset)
+            return
+        
+        # Grey level v maps to v in each of the R, G and B fields of the pixel
+        r_shift, g_shift, b_shift, _ = screen.get_shifts()
+        grey = np.uint32((1 << r_shift) | (1 << g_shift) | (1 << b_shift))
         
-        for _ in range(star_count):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            size = random.randint(1, 2)  # Limit max size to 2
-            period = random.uniform(2000, 6000)  # 2-6 seconds
-            self.stars.append(Star(x, y, size, period))
-    
-    def draw(self, screen, time_ms):
-        """Draw all stars with current opacity."""
-        for star in self.stars:
-            opacity = star.get_opacity(time_ms)
-            color_value = int(255 * opacity)
-            color = (color_value, color_value, color_value)
+        pixels = pygame.surfarray.pixels2d(screen)
+        for layer in self.layers:
+            colors = layer.get_values(time_ms).astype(np.uint32) * grey
+            xs, ys = layer.get_positions(offset)
+            pixels[xs, ys] = colors
             
-            if star.size == 1:
-                screen.set_at((int(star.x), int(star.y)), color)
-            else:
-                pygame.draw.circle(screen, color, (int(star.x), int(star.y)), star.size)
+            # Size-2 stars: stamp the disc footprint around each centre
+            if len(layer.large):
+                big_x = (xs[layer.large][:, None] + self.disc_dx) % self.screen_width
+                big_y = (ys[layer.large][:, None] + self.disc_dy) % self.screen_height
+                pixels[big_x, big_y] = colors[layer.large][:, None]
+        del pixels  # Unlock the screen
+    
+    def _draw_slow(self, screen, time_ms, offset):
+        """Per-star fallback for surfaces that aren't 32 bits per pixel."""
+        for layer in self.layers:
+            values = layer.get_values(time_ms)
+            xs, ys = layer.get_positions(offset)
+            for x, y, size, value in zip(xs.tolist(), ys.tolist(), layer.size.tolist(), values.tolist()):
+                color = (value, value, value)
+                if size == 1:
+                    screen.set_at((x, y), color)
+                else:
+                    pygame.draw.circle(screen, color, (x, y), size)
@@ -0,0 +1,192 @@
+"""Headless parameter sweep: strength x smoothness rounds across a process pool."""
+import os
+import csv
+import json
+import math
+import time
+import argparse
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from simulation import Simulation
+from replay import Recording
+from spatial import wrapped_delta
+from autopilot import Autopilot
+
+
+# Same playfield as the window
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+
+# Parameter range accepted by SwipeProcessor.set_parameter
+PARAMETER_VALUES = range(11)
+
+
+def chase_policy(sim):
+    """Scripted input: swipe toward the collectible, braking to a cruise speed."""
+    player = sim.player
+    dx = wrapped_delta(sim.collectible.x - player.x, sim.screen_width)
+    dy = wrapped_delta(sim.collectible.y - player.y, sim.screen_height)
+    distance = math.sqrt(dx * dx + dy * dy) or 1.0
+    
+    # Steer the velocity toward 300 px/s at the target
+    cruise = 300.0
+    error_x = dx / distance * cruise - player.vx
+    error_y = dy / distance * cruise - player.vy
+    
+    # A mouse moves a whole number of pixels, and only so far in one frame
+    limit = 20
+    return (int(max(-limit, min(limit, error_x / 10))),
+            int(max(-limit, min(limit, error_y / 10))))
+
+
+# Policy factories, called with (seed, tick_rate) for each round
+POLICIES = {
+    'chase': lambda seed, tick_rate: chase_policy,
+    'autopilot': lambda seed, tick_rate: Autopilot(rate=tick_rate, seed=seed),
+}
+
+# Recording loaded once per worker process (see _load_recording)
+_recording = None
+
+
+def _load_recording(path):
+    global _recording
+    _recording = Recording.load(path) if path else None
+
+
+def _play_recording(sim, recording):
+    """Feed a recording's motion, title skip, ticks and releases into sim for one round.
+
+    Its parameter changes and round choices are skipped, so the sweep's
+    setting holds for the whole round.
+    """
+    for command in recording.commands:
+        kind = command[0]
+        if kind == 'motion':
+            sim.add_motion(*command[1:])
+        elif kind == 'skip_title':
+            sim.skip_title()
+        elif kind == 'step':
+            sim.step(command[1], release_input=command[2])
+            if 'round_over' in sim.events:
+                return
+        elif kind == 'release':
+            sim.release_input()
+
+
+def run_round(strength, smoothness, seed, policy, round_duration, tick_rate):
+    """Play one headless round at a parameter setting. Returns (score, collisions)."""
+    if _recording is not None:
+        sim = Simulation(_recording.screen_width, _recording.screen_height,
+                         round_duration=_recording.round_duration,
+                         title_duration=_recording.title_duration, seed=seed,
+                         maze=_recording.maze, maze_cell_size=_recording.maze_cell_size)
+    else:
+        sim = Simulation(SCREEN_WIDTH, SCREEN_HEIGHT, round_duration=round_duration, seed=seed)
+    sim.swipe_processor.set_parameter('strength', strength)
+    sim.swipe_processor.set_parameter('smoothness', smoothness)
+    
+    if _recording is not None:
+        _play_recording(sim, _recording)
+        return sim.score, sim.collisions
+    score = sim.run_round(1.0 / tick_rate, POLICIES[policy](seed, tick_rate))
+    return score, sim.collisions
+
+
+def _run_task(task):
+    return task, run_round(*task)
+
+
+def sweep(seeds, policy='chase', recording=None, round_duration=60.0, tick_rate=60,
+          strengths=PARAMETER_VALUES, smoothnesses=PARAMETER_VALUES, workers=None):
+    """Run every (strength, smoothness, seed) round across a process pool.
+
+    Returns one row per cell with score and collision statistics over
+    the seeds.
+    """
+    tasks = [(strength, smoothness, seed, policy, round_duration, tick_rate)
+             for strength in strengths for smoothness in smoothnesses for seed in seeds]
+    
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_load_recording,
+                             initargs=(recording,)) as pool:
+        chunksize = max(1, len(tasks) // ((workers or os.cpu_count() or 1) * 4))
+        for task, (score, collisions) in pool.map(_run_task, tasks, chunksize=chunksize):
+            results.setdefault((task[0], task[1]), []).append((score, collisions))
+    
+    rows = []
+    for (strength, smoothness), runs in sorted(results.items()):
+        scores = [score for score, _ in runs]
+        collisions = [hits for _, hits in runs]
+        rows.append({
+            'strength': strength,
+            'smoothness': smoothness,
+            'rounds': len(runs),
+            'score_mean': statistics.mean(scores),
+            'score_stdev': statistics.pstdev(scores),
+            'score_min': min(scores),
+            'score_max': max(scores),
+            'collisions_mean': statistics.mean(collisions),
+            'collisions_max': max(collisions),
+        })
+    return rows
+
+
+def write_results(rows, path):
+    """Write sweep rows as JSON (.json) or CSV (anything else)."""
+    with open(path, 'w', newline='') as f:
+        if path.endswith('.json'):
+            json.dump(rows, f, indent=2)
+        else:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Sweep strength x smoothness over headless rounds')
+    parser.add_argument('--seeds', type=int, default=4,
+                        help='Rounds per cell, with world seeds 0..N-1 (default 4)')
+    parser.add_argument('--policy', choices=sorted(POLICIES),
+                        help='Scripted input policy (default chase)')
+    parser.add_argument('--recording', metavar='PATH',
+                        help='Drive every round with a recorded session\'s input instead of a policy '
+                             '(its own round length and tick timing apply)')
+    parser.add_argument('--round-duration', type=float,
+                        help='Round length in seconds (default 60)')
+    parser.add_argument('--tick-rate', type=int, choices=[30, 60, 120, 240],
+                        help='Physics ticks per second (default 60)')
+    parser.add_argument('--workers', type=int,
+                        help='Worker processes (default: one per CPU)')
+    parser.add_argument('--output', default='sweep.csv',
+                        help='Results file, .csv or .json (default sweep.csv)')
+    args = parser.parse_args()
+    if args.seeds < 1:
+        parser.error("--seeds must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    # A recording brings its own input, round length and tick timing
+    if args.recording is not None:
+        for option, value in (('--policy', args.policy), ('--round-duration', args.round_duration),
+                              ('--tick-rate', args.tick_rate)):
+            if value is not None:
+                parser.error(f"{option} can't be used with --recording")
+    policy = args.policy or 'chase'
+    round_duration = 60.0 if args.round_duration is None else args.round_duration
+    tick_rate = args.tick_rate or 60
+    
+    start = time.perf_counter()
+    rows = sweep(range(args.seeds), policy=policy, recording=args.recording,
+                 round_duration=round_duration, tick_rate=tick_rate, workers=args.workers)
+    write_results(rows, args.output)
+    
+    best = max(rows, key=lambda row: row['score_mean'])
+    print(f"{len(rows)} cells x {args.seeds} seeds in {time.perf_counter() - start:.1f}s -> {args.output}")
+    print(f"Best: strength {best['strength']}, smoothness {best['smoothness']} "
+          f"(mean score {best['score_mean']:.2f})")
+
+
+if __name__ == "__main__":
+    main()
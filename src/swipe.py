@@ -1,13 +1,21 @@
 """Swipe capture and processing with configurable parameters."""
-import math
+import numpy as np
 
 
 class SwipeProcessor:
-    """Processes swipe input through Focus, Smoothness, and Strength filters."""
+    """Processes swipe input through Focus, Smoothness, and Strength filters.
+    
+    Points are processed as they stream in. Smoothness averages the
+    segment vectors at the end of the focused portion, and a sum of
+    consecutive segments telescopes to the difference of its end points,
+    so the recorded point positions are the running aggregate. end_swipe
+    only looks up two points and is O(1) however long the swipe was.
+    """
     
     def __init__(self):
         # Parameters range from 0-10
         self.strength = 5
+        self.focus = 5
         self.smoothness = 5
         
         # Swipe data
@@ -16,7 +24,7 @@ class SwipeProcessor:
         
         # Store the focus start index after processing
         self.last_focus_start_index = 0
-        
+    
     def start_swipe(self, x, y):
         """Begin capturing a swipe."""
         self.is_swiping = True
@@ -37,67 +45,40 @@ class SwipeProcessor:
         self.is_swiping = False
         
         # Step 1: Focus Filter - select portion of swipe
-        focused_points, focus_start_index = self._apply_focus()
+        count, focus_start_index = self._apply_focus(len(self.points))
         self.last_focus_start_index = focus_start_index
         
-        if len(focused_points) < 2:
-            return (0, 0)
-        
         # Step 2: Smoothness - average direction vectors
-        direction = self._apply_smoothness(focused_points)
+        direction = self._apply_smoothness(count)
         
         # Step 3: Strength - scale the magnitude
         impulse = self._apply_strength(direction)
         
         return impulse
     
-    def _apply_focus(self):
+    def _apply_focus(self, length):
         """Select which portion of the swipe to use based on focus parameter.
-        Returns (focused_points, start_index_in_original)."""
-        if len(self.points) < 2:
-            return self.points, 0
-        
+        Returns (focused_point_count, start_index_in_original)."""
         # Focus 0 = last 10% of swipe
         # Focus 10 = entire swipe (100%)
         portion = 0.1 + (self.focus / 10) * 0.9  # 0.1 to 1.0
         
-        count = max(2, int(len(self.points) * portion))
-        start_index = len(self.points) - count
-        return self.points[-count:], start_index
+        count = min(length, max(2, int(length * portion)))
+        return count, length - count
     
-    def _apply_smoothness(self, points):
-        """Average direction vectors based on smoothness parameter."""
-        if len(points) < 2:
-            return (0, 0)
-        
+    def _apply_smoothness(self, count):
+        """Average direction vectors over the end of the last count points."""
         # Smoothness 0 = only last segment
         # Smoothness 10 = average all segments
-        segments_to_use = max(1, int((len(points) - 1) * (self.smoothness / 10)))
-        
-        # Calculate direction vectors for the last N segments
-        dx_sum = 0
-        dy_sum = 0
-        count = 0
-        
-        start_idx = len(points) - 1 - segments_to_use
-        start_idx = max(0, start_idx)
+        segments_to_use = max(1, int((count - 1) * (self.smoothness / 10)))
         
-        for i in range(start_idx, len(points) - 1):
-            dx = points[i + 1][0] - points[i][0]
-            dy = points[i + 1][1] - points[i][1]
-            dx_sum += dx
-            dy_sum += dy
-            count += 1
-        
-        if count == 0:
-            # Fallback to first and last point
-            dx_sum = points[-1][0] - points[0][0]
-            dy_sum = points[-1][1] - points[0][1]
-            count = 1
+        # Sum of the last N segment vectors = last point - point N back
+        last_x, last_y = self.points[-1]
+        first_x, first_y = self.points[-1 - segments_to_use]
         
         # Average
-        avg_dx = dx_sum / count
-        avg_dy = dy_sum / count
+        avg_dx = (last_x - first_x) / segments_to_use
+        avg_dy = (last_y - first_y) / segments_to_use
         
         return (avg_dx, avg_dy)
     
@@ -124,6 +105,8 @@ class SwipeProcessor:
         
         if param_name == 'strength':
             self.strength = value
+        elif param_name == 'focus':
+            self.focus = value
         elif param_name == 'smoothness':
             self.smoothness = value
     
@@ -131,5 +114,46 @@ class SwipeProcessor:
         """Return current parameter values."""
         return {
             'strength': self.strength,
+            'focus': self.focus,
             'smoothness': self.smoothness
-        }
\ No newline at end of file
+        }
+
+
+def evaluate_swipes(swipes, strength, focus, smoothness):
+    """Impulses for many recorded swipes under many parameter settings at once.
+    
+    swipes is a sequence of point lists or (n, 2) arrays. strength, focus
+    and smoothness are scalars or equal-length arrays of parameter settings
+    (0-10). Returns an array of shape (len(swipes), settings, 2) matching
+    SwipeProcessor.end_swipe for every swipe and setting; swipes with fewer
+    than two points give (0, 0).
+    """
+    strength, focus, smoothness = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(p, dtype=float)) for p in (strength, focus, smoothness)))
+    
+    # Pad the swipes into one (swipes, max_length, 2) array
+    lengths = np.array([len(points) for points in swipes], dtype=np.int64)
+    padded = np.zeros((len(swipes), max(2, int(lengths.max(initial=0))), 2))
+    for i, points in enumerate(swipes):
+        if lengths[i]:
+            padded[i, :lengths[i]] = points
+    
+    # Focus: how many trailing points are used, per (swipe, setting)
+    length = lengths[:, None]
+    portion = 0.1 + (focus / 10) * 0.9
+    count = np.minimum(length, np.maximum(2, (length * portion).astype(np.int64)))
+    
+    # Smoothness: how many trailing segments are averaged
+    segments = np.maximum(1, ((count - 1) * (smoothness / 10)).astype(np.int64))
+    
+    # Telescoped segment sum: last point minus the point segments back
+    rows = np.arange(len(swipes))[:, None]
+    last = padded[rows, np.maximum(length - 1, 0)]
+    first = padded[rows, np.maximum(length - 1 - segments, 0)]
+    direction = (last - first) / segments[..., None]
+    
+    # Strength
+    multiplier = 0.1 + (strength / 10) * 0.9
+    impulse = direction * multiplier[None, :, None]
+    impulse[lengths < 2] = 0.0
+    return impulse
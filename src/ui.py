@@ -1,5 +1,35 @@
 """UI display for score and parameters."""
+from collections import OrderedDict
 import pygame
+from effects import flame_colors
+
+
+class TextCache:
+    """Rendered text surfaces keyed by (font, text, color, alpha), LRU evicted.
+    
+    HUD strings change a few times a second at most, so most frames only
+    pay for a dictionary lookup and a blit.
+    """
+    
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+    
+    def render(self, font, text, color, alpha=None):
+        """Return an antialiased surface for text, rendering it on a miss."""
+        key = (font, text, color, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
 
 
 class UI:
@@ -9,11 +39,13 @@ class UI:
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        # Font
+        # Fonts (created once) and rendered-text cache
         pygame.font.init()
+        self.font_title = pygame.font.Font(None, 96)
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
+        self.text = TextCache()
         
         # UI color: white with slight transparency
         self.color = (255, 255, 255)
@@ -21,37 +53,56 @@ class UI:
         
         # Level transition clickable buttons
         self.transition_buttons = []
+        self.transition_layout = self._layout_transition_buttons()
+        
+        # Static screens are rendered once and then just blitted
+        self.title_frame = None
+        self.transition_frame = None
+        self.transition_key = None
     
     def draw(self, screen, score, time_remaining, params):
-        """Draw the UI elements."""
+        """Draw the UI elements. Returns the rects drawn."""
         # Score in top-left
         score_text = f"Score: {score}"
-        score_surface = self.font_large.render(score_text, True, self.color)
-        score_surface.set_alpha(self.alpha)
-        screen.blit(score_surface, (20, 20))
+        score_surface = self.text.render(self.font_large, score_text, self.color, self.alpha)
+        score_rect = screen.blit(score_surface, (20, 20))
         
         # Timer in top-right
         timer_text = f"{int(time_remaining)}s"
         timer_color = (255, 100, 100) if time_remaining < 10 else self.color
-        timer_surface = self.font_large.render(timer_text, True, timer_color)
-        timer_surface.set_alpha(self.alpha)
+        timer_surface = self.text.render(self.font_large, timer_text, timer_color, self.alpha)
         timer_width = timer_surface.get_width()
-        screen.blit(timer_surface, (self.screen_width - timer_width - 20, 20))
+        timer_rect = screen.blit(timer_surface, (self.screen_width - timer_width - 20, 20))
+        return [score_rect, timer_rect]
+    
+    def _new_frame(self):
+        """Full-screen surface in the display's pixel format for a cached screen."""
+        frame = pygame.Surface((self.screen_width, self.screen_height))
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert()
+        return frame
     
     def draw_title_screen(self, screen):
-        """Draw the title screen."""
+        """Draw the title screen (rendered once, then blitted)."""
+        if self.title_frame is None:
+            self.title_frame = self._new_frame()
+            self._render_title_screen(self.title_frame)
+        screen.blit(self.title_frame, (0, 0))
+    
+    def _render_title_screen(self, screen):
+        """Render the title screen."""
         # Background
         screen.fill((0, 0, 0))
         
         # Title: SWIPEY
         title = "SWIPEY"
-        title_surface = pygame.font.Font(None, 96).render(title, True, (100, 150, 255))
+        title_surface = self.text.render(self.font_title, title, (100, 150, 255))
         title_width = title_surface.get_width()
         screen.blit(title_surface, ((self.screen_width - title_width) // 2, 200))
         
         # Tagline
         tagline = "The parameter optimization simulator"
-        tagline_surface = self.font_medium.render(tagline, True, (180, 180, 180))
+        tagline_surface = self.text.render(self.font_medium, tagline, (180, 180, 180))
         tagline_width = tagline_surface.get_width()
         screen.blit(tagline_surface, ((self.screen_width - tagline_width) // 2, 300))
         
@@ -73,51 +124,80 @@ class UI:
             (swipe_center_x + 85, swipe_center_y + 15)
         ])
     
+    def _layout_transition_buttons(self):
+        """Compute the transition screen's rows and button rects once.
+        
+        Returns a list of (param_name, row_y, minus_button, plus_button).
+        """
+        # Only strength and smoothness are offered
+        param_names = ['strength', 'smoothness']
+        
+        # Center the parameters vertically and horizontally
+        param_row_height = 120
+        total_height = len(param_names) * param_row_height
+        y_start_centered = (self.screen_height - total_height) // 2
+        center_x = self.screen_width // 2
+        
+        # All buttons same width
+        button_width = 100
+        button_spacing = 60  # Gap between left and right buttons
+        
+        layout = []
+        for i, param_name in enumerate(param_names):
+            y = y_start_centered + i * param_row_height
+            minus_button = pygame.Rect(center_x - button_spacing // 2 - button_width, y + 15, button_width, 30)
+            plus_button = pygame.Rect(center_x + button_spacing // 2, y + 15, button_width, 30)
+            layout.append((param_name, y, minus_button, plus_button))
+        return layout
+    
+    def transition_button(self, param_name, delta):
+        """Rect of the transition screen's minus (delta < 0) or plus button for a parameter."""
+        for name, _, minus_button, plus_button in self.transition_layout:
+            if name == param_name:
+                return minus_button if delta < 0 else plus_button
+        return None
+    
     def draw_level_transition(self, screen, level, params):
-        """Draw the level transition screen with parameter adjustment options."""
-        # Semi-transparent dark background
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(240)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        """Draw the level transition screen with parameter adjustment options.
+        
+        The screen only changes with the level and parameter values, so it is
+        re-rendered just when those change and blitted otherwise.
+        """
+        key = (level,) + tuple(params[name] for name, _, _, _ in self.transition_layout)
+        if key != self.transition_key:
+            if self.transition_frame is None:
+                self.transition_frame = self._new_frame()
+            self._render_level_transition(self.transition_frame, level, params)
+            self.transition_key = key
+        screen.blit(self.transition_frame, (0, 0))
+    
+    def _render_level_transition(self, screen, level, params):
+        """Render the transition screen and record its active buttons."""
+        # Dark background
+        screen.fill((0, 0, 0))
         
         # Title
         if level == 0:
             title = "ROUND 1 STARTING"
         else:
             title = f"ROUND {level} COMPLETE!"
-        title_surface = self.font_large.render(title, True, (100, 150, 255))
+        title_surface = self.text.render(self.font_large, title, (100, 150, 255))
         title_width = title_surface.get_width()
         screen.blit(title_surface, ((self.screen_width - title_width) // 2, 40))
         
         # Store buttons for click detection
         self.transition_buttons = []
         
-        # Draw each parameter with -1 and +1 buttons (only strength and smoothness)
-        param_names = ['strength', 'smoothness']
-        
-        # Center the parameters vertically and horizontally
-        param_row_height = 120
-        total_height = len(param_names) * param_row_height
-        y_start_centered = (self.screen_height - total_height) // 2
-        
         # Subtitle positioned just above choices
+        y_start_centered = self.transition_layout[0][1]
         subtitle = "Choose one parameter adjustment"
-        subtitle_surface = self.font_medium.render(subtitle, True, (200, 200, 200))
+        subtitle_surface = self.text.render(self.font_medium, subtitle, (200, 200, 200))
         subtitle_width = subtitle_surface.get_width()
         screen.blit(subtitle_surface, ((self.screen_width - subtitle_width) // 2, y_start_centered - 50))
         
-        # All buttons same width
-        button_width = 100
-        button_spacing = 60  # Gap between left and right buttons
-        
-        for i, param_name in enumerate(param_names):
-            y = y_start_centered + i * param_row_height
+        for i, (param_name, y, minus_button, plus_button) in enumerate(self.transition_layout):
             current_value = params[param_name]
             
-            # Center X position
-            center_x = self.screen_width // 2
-            
             # Set labels
             if i == 0:  # Strength
                 minus_text_label = "WEAK"
@@ -127,11 +207,10 @@ class UI:
                 plus_text_label = "SMOOTH"
             
             # LEFT: -1 button
-            minus_button = pygame.Rect(center_x - button_spacing // 2 - button_width, y + 15, button_width, 30)
             minus_color = (150, 50, 50) if current_value > 0 else (80, 30, 30)
             pygame.draw.rect(screen, minus_color, minus_button)
             pygame.draw.rect(screen, (255, 255, 255), minus_button, 2)
-            minus_text = self.font_small.render(minus_text_label, True, (255, 255, 255))
+            minus_text = self.text.render(self.font_small, minus_text_label, (255, 255, 255))
             minus_text_rect = minus_text.get_rect(center=minus_button.center)
             screen.blit(minus_text, minus_text_rect)
             if current_value > 0:
@@ -148,11 +227,10 @@ class UI:
             # (removed the display code)
             
             # RIGHT: +1 button
-            plus_button = pygame.Rect(center_x + button_spacing // 2, y + 15, button_width, 30)
             plus_color = (50, 150, 50) if current_value < 10 else (30, 80, 30)
             pygame.draw.rect(screen, plus_color, plus_button)
             pygame.draw.rect(screen, (255, 255, 255), plus_button, 2)
-            plus_text = self.font_small.render(plus_text_label, True, (255, 255, 255))
+            plus_text = self.text.render(self.font_small, plus_text_label, (255, 255, 255))
             plus_text_rect = plus_text.get_rect(center=plus_button.center)
             screen.blit(plus_text, plus_text_rect)
             if current_value < 10:
@@ -167,7 +245,7 @@ class UI:
         
         # Instructions at bottom
         instr_text = "Click a button to adjust and continue"
-        instr_surface = self.font_small.render(instr_text, True, (200, 200, 200))
+        instr_surface = self.text.render(self.font_small, instr_text, (200, 200, 200))
         instr_width = instr_surface.get_width()
         screen.blit(instr_surface, ((self.screen_width - instr_width) // 2, self.screen_height - 60))
     
@@ -213,7 +291,7 @@ class UI:
             base_x = tip_x + thrust_length
         
         # Get color based on magnitude using game's color map
-        outer_color, middle_color, core_color = self._get_flame_colors(thrust_length)
+        outer_color, middle_color, core_color = flame_colors(thrust_length)
         
         # Triangular flame
         pygame.draw.polygon(screen, outer_color, [
@@ -222,26 +300,6 @@ class UI:
             (tip_x, tip_y)
         ])
     
-    def _get_flame_colors(self, magnitude):
-        """Get flame colors based on magnitude (energy). Blue=weak, Yellow=medium, Red=strong."""
-        # Normalize magnitude to 0-1 range (assuming max useful magnitude around 15)
-        t = min(1.0, magnitude / 15.0)
-        
-        if t < 0.5:
-            # Blue to Yellow (low to medium energy)
-            inner_t = t * 2
-            outer = (int(100 + 155 * inner_t), int(150 + 105 * inner_t), int(255 - 255 * inner_t))
-            middle = (int(150 + 105 * inner_t), int(200 + 55 * inner_t), int(255 - 205 * inner_t))
-            core = (int(200 + 55 * inner_t), int(250 + 5 * inner_t), int(255 - 155 * inner_t))
-        else:
-            # Yellow to Red (medium to high energy)
-            inner_t = (t - 0.5) * 2
-            outer = (255, int(255 - 205 * inner_t), 0)
-            middle = (255, int(255 - 105 * inner_t), int(50 - 50 * inner_t))
-            core = (255, int(255 - 55 * inner_t), int(100 - 100 * inner_t))
-        
-        return outer, middle, core
-    
     def _draw_smoothness_visual(self, screen, x, y, less):
         """Draw smoothness parameter visual."""
         # Player circle (blue like in game) - use actual game radius (3% of screen width)
@@ -273,17 +331,23 @@ class UI:
                 perp_y = math.cos(angle)
                 
                 # Get color and apply alpha
-                outer_color, _, _ = self._get_flame_colors(thrust_length)
+                outer_color, _, _ = flame_colors(thrust_length)
                 
-                # Create surface with alpha for this thruster
-                temp_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-                flame_color_with_alpha = outer_color + (alpha,)
-                pygame.draw.polygon(temp_surface, flame_color_with_alpha, [
+                # Flame-sized surface with alpha for this thruster
+                points = [
                     (base_x + perp_x * base_width / 2, base_y + perp_y * base_width / 2),
                     (base_x - perp_x * base_width / 2, base_y - perp_y * base_width / 2),
                     (tip_x, tip_y)
-                ])
-                screen.blit(temp_surface, (0, 0))
+                ]
+                left = int(min(p[0] for p in points)) - 1
+                top = int(min(p[1] for p in points)) - 1
+                width = int(max(p[0] for p in points)) + 2 - left
+                height = int(max(p[1] for p in points)) + 2 - top
+                temp_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+                flame_color_with_alpha = outer_color + (alpha,)
+                pygame.draw.polygon(temp_surface, flame_color_with_alpha,
+                                    [(px - left, py - top) for px, py in points])
+                screen.blit(temp_surface, (left, top))
         else:
             # Single unified flame exactly to the right (smooth) - pointing right
             thrust_length = 30
@@ -297,7 +361,7 @@ class UI:
             base_x = tip_x + thrust_length
             
             # Get color based on magnitude
-            outer_color, _, _ = self._get_flame_colors(thrust_length)
+            outer_color, _, _ = flame_colors(thrust_length)
             
             # Triangular flame
             pygame.draw.polygon(screen, outer_color, [
@@ -316,7 +380,7 @@ class UI:
         
         # Title
         title = "SWIPE PARAMETERS GUIDE"
-        title_surface = self.font_large.render(title, True, (100, 150, 255))
+        title_surface = self.text.render(self.font_large, title, (100, 150, 255))
         title_width = title_surface.get_width()
         screen.blit(title_surface, ((self.screen_width - title_width) // 2, 40))
         
@@ -348,24 +412,24 @@ class UI:
         
         # Bottom instructions
         dismiss_text = "Press SPACE to start playing"
-        dismiss_surface = self.font_medium.render(dismiss_text, True, (255, 255, 100))
+        dismiss_surface = self.text.render(self.font_medium, dismiss_text, (255, 255, 100))
         dismiss_width = dismiss_surface.get_width()
         screen.blit(dismiss_surface, ((self.screen_width - dismiss_width) // 2, self.screen_height - 60))
     
     def _draw_parameter_demo(self, screen, x, y, title, description, details, visual_func):
         """Draw a parameter explanation section."""
         # Title
-        title_surface = self.font_medium.render(title, True, (255, 200, 100))
+        title_surface = self.text.render(self.font_medium, title, (255, 200, 100))
         screen.blit(title_surface, (x, y))
         
         # Description
-        desc_surface = self.font_small.render(description, True, (200, 200, 200))
+        desc_surface = self.text.render(self.font_small, description, (200, 200, 200))
         screen.blit(desc_surface, (x, y + 35))
         
         # Details
         detail_y = y + 65
         for detail in details:
-            detail_surface = self.font_small.render(detail, True, (180, 180, 180))
+            detail_surface = self.text.render(self.font_small, detail, (180, 180, 180))
             screen.blit(detail_surface, (x, detail_y))
             detail_y += 25
         